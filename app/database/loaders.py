@@ -0,0 +1,121 @@
+from typing import Any, Callable, Dict, Hashable, Iterable
+
+from neo4j import Session
+
+from app.database.neo4j import read
+from app.profiling import phase
+
+
+class DataLoader:
+    """
+    Batcher façon DataLoader : regroupe les lectures par id en une seule
+    requête Cypher `UNWIND $ids` et mémorise les résultats pour la durée
+    d'une requête HTTP (un DataLoader par requête, voir Loaders).
+    """
+
+    def __init__(self, db: Session, cypher: str, default: Callable[[], Any] = lambda: None, **params):
+        self._db = db
+        self._cypher = cypher
+        self._default = default
+        self._params = params
+        self._cache: Dict[Hashable, Any] = {}
+
+    def load_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        """
+        Renvoie {key: valeur} pour toutes les clés demandées ; seules les clés
+        absentes du cache déclenchent une (unique) requête.
+        """
+        keys = list(dict.fromkeys(k for k in keys if k is not None))
+        missing = [k for k in keys if k not in self._cache]
+        if missing:
+            records = read(self._db, self._cypher, ids=missing, **self._params)
+            with phase("decode"):
+                for record in records:
+                    self._cache[record["id"]] = record["value"]
+            for k in missing:
+                self._cache.setdefault(k, self._default())
+        return {k: self._cache[k] for k in keys}
+
+
+# Chaque requête renvoie une ligne (id, value) par id demandé
+
+ARTICLES_BY_ID = """
+UNWIND $ids AS id
+MATCH (a:Article {id: id})
+RETURN id, a AS value
+"""
+
+ARTICLE_AUTHORS = """
+UNWIND $ids AS id
+MATCH (a:Article {id: id})-[:WRITTEN_BY]->(au:Author)
+RETURN id, collect(au) AS value
+"""
+
+ARTICLE_TOPICS = """
+UNWIND $ids AS id
+MATCH (a:Article {id: id})-[:HAS_TOPIC]->(t:Topic)
+RETURN id, collect(t) AS value
+"""
+
+ARTICLE_TAGS = """
+UNWIND $ids AS id
+MATCH (a:Article {id: id})-[:HAS_TAG]->(tag:Tag)
+RETURN id, collect(tag) AS value
+"""
+
+ARTICLE_RELATED = """
+UNWIND $ids AS id
+MATCH (a:Article {id: id})-[r:RELATED_ARTICLE]->(other:Article)
+WHERE NOT (other)-[:DUPLICATE_OF]->(:Article)
+WITH id, other, coalesce(r.score, 0.0) AS score
+ORDER BY score DESC
+RETURN id, collect({article: other, score: score})[..$limit] AS value
+"""
+
+AUTHOR_ARTICLES = """
+UNWIND $ids AS id
+MATCH (au:Author {id: id})<-[:WRITTEN_BY]-(a:Article)
+RETURN id, collect(a) AS value
+"""
+
+TOPIC_RELATED_TOPICS = """
+UNWIND $ids AS id
+MATCH (t:Topic {name: id})-[:RELATED_TO_TOPIC]-(rt:Topic)
+RETURN id, collect(DISTINCT rt) AS value
+"""
+
+TOPIC_ARTICLES = """
+UNWIND $ids AS id
+MATCH (t:Topic {name: id})<-[:HAS_TOPIC]-(a:Article)
+RETURN id, collect(a) AS value
+"""
+
+
+# Requêtes planifiées au démarrage (voir app.database.neo4j.warmup)
+WARMUP_QUERIES = [
+    (ARTICLES_BY_ID, {"ids": []}),
+    (ARTICLE_AUTHORS, {"ids": []}),
+    (ARTICLE_TOPICS, {"ids": []}),
+    (ARTICLE_TAGS, {"ids": []}),
+    (ARTICLE_RELATED, {"ids": [], "limit": 10}),
+    (AUTHOR_ARTICLES, {"ids": []}),
+    (TOPIC_RELATED_TOPICS, {"ids": []}),
+    (TOPIC_ARTICLES, {"ids": []}),
+]
+
+
+class Loaders:
+    """
+    Ensemble des DataLoaders d'une requête : à instancier par requête HTTP
+    pour que le cache ne survive pas à celle-ci.
+    """
+
+    def __init__(self, db: Session, related_limit: int = 10):
+        self.articles = DataLoader(db, ARTICLES_BY_ID)
+        self.article_authors = DataLoader(db, ARTICLE_AUTHORS, default=list)
+        self.article_topics = DataLoader(db, ARTICLE_TOPICS, default=list)
+        self.article_tags = DataLoader(db, ARTICLE_TAGS, default=list)
+        self.article_related = DataLoader(db, ARTICLE_RELATED, default=list, limit=related_limit)
+        self.author_articles = DataLoader(db, AUTHOR_ARTICLES, default=list)
+        self.topic_related_topics = DataLoader(db, TOPIC_RELATED_TOPICS, default=list)
+        self.topic_articles = DataLoader(db, TOPIC_ARTICLES, default=list)
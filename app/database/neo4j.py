@@ -1,21 +1,39 @@
+import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
-from typing import Generator
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple
 
-from neo4j import GraphDatabase, Driver, Session, basic_auth
+from neo4j import GraphDatabase, Driver, ManagedTransaction, Record, Session, basic_auth
+
+from app.profiling import phase
+
+logger = logging.getLogger(__name__)
 
 
 @lru_cache
 def get_driver() -> Driver:
     """
     Initialise et renvoie un driver Neo4j (singleton grâce à lru_cache).
-    Les infos de connexion viennent des variables d'environnement.
+    Les infos de connexion et le réglage du pool viennent des variables d'environnement.
     """
     uri = os.getenv("NEO4J_URI", "bolt://neo4j:7687")
     user = os.getenv("NEO4J_USER", "neo4j")
     password = os.getenv("NEO4J_PASSWORD", "password")
 
-    driver = GraphDatabase.driver(uri, auth=basic_auth(user, password))
+    driver = GraphDatabase.driver(
+        uri,
+        auth=basic_auth(user, password),
+        # Taille max du pool de connexions Bolt
+        max_connection_pool_size=int(os.getenv("NEO4J_MAX_POOL_SIZE", "100")),
+        # Attente max (s) pour obtenir une connexion du pool
+        connection_acquisition_timeout=float(os.getenv("NEO4J_ACQUISITION_TIMEOUT", "60")),
+        # Durée de vie max (s) d'une connexion avant renouvellement
+        max_connection_lifetime=float(os.getenv("NEO4J_MAX_CONNECTION_LIFETIME", "3600")),
+        # Durée max (s) des nouvelles tentatives de execute_read / execute_write
+        max_transaction_retry_time=float(os.getenv("NEO4J_MAX_RETRY_TIME", "15")),
+    )
     return driver
 
 
@@ -32,6 +50,83 @@ def get_db() -> Generator[Session, None, None]:
         session.close()
 
 
+def _fetch_all(tx: ManagedTransaction, query: str, params: Dict[str, Any]) -> List[Record]:
+    # tx.run() rend la main dès l'en-tête RUN : les allers-retours PULL qui
+    # ramènent les records ont lieu pendant la lecture, comptée aussi en "db"
+    with phase("db"):
+        result = tx.run(query, params)
+        records = list(result)
+        result.consume()
+    return records
+
+
+def read(db: Session, query: str, /, **params) -> List[Record]:
+    """
+    Exécute une lecture dans une transaction gérée (execute_read) : en cas
+    d'erreur transitoire (connexion perdue, leader changé, deadlock...), le
+    driver rejoue la transaction avec back-off exponentiel, pendant au plus
+    NEO4J_MAX_RETRY_TIME secondes. Les records sont entièrement lus dans la
+    transaction.
+    """
+    return db.execute_read(_fetch_all, query, params)
+
+
+def read_single(db: Session, query: str, /, **params) -> Optional[Record]:
+    """
+    Comme read(), mais renvoie le premier record (ou None).
+    """
+    records = read(db, query, **params)
+    return records[0] if records else None
+
+
+def warmup(queries: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+    """
+    Préchauffage au démarrage, avant de servir les requêtes :
+    - ouvre NEO4J_WARMUP_CONNECTIONS connexions du pool en parallèle ;
+    - fait planifier (EXPLAIN) chaque requête Cypher des routers, avec des
+      paramètres représentatifs, pour remplir le cache de plans de Neo4j.
+    Les erreurs sont journalisées sans bloquer le démarrage.
+    """
+    driver = get_driver()
+    # Au-delà de la taille du pool, les sessions attendraient une connexion
+    connections = min(
+        int(os.getenv("NEO4J_WARMUP_CONNECTIONS", "10")),
+        int(os.getenv("NEO4J_MAX_POOL_SIZE", "100")),
+    )
+
+    try:
+        if connections > 0:
+            # Les sessions restent ouvertes jusqu'à ce que toutes aient leur
+            # connexion : le pool en contient alors réellement `connections`.
+            barrier = threading.Barrier(connections)
+
+            def open_connection():
+                with driver.session() as session:
+                    try:
+                        session.run("RETURN 1").consume()
+                    except Exception:
+                        barrier.abort()
+                        raise
+                    try:
+                        barrier.wait(timeout=10)
+                    except threading.BrokenBarrierError:
+                        pass
+
+            with ThreadPoolExecutor(max_workers=connections) as pool:
+                for future in [pool.submit(open_connection) for _ in range(connections)]:
+                    future.result()
+
+        planned = 0
+        with driver.session() as session:
+            for query, params in queries:
+                session.run("EXPLAIN " + query, params).consume()
+                planned += 1
+        logger.info("Neo4j warmup: %d connections opened, %d queries planned", connections, planned)
+    except Exception as exc:  # pylint: disable=broad-except
+        # Neo4j pas encore prêt, etc. : le pool se remplira à la demande
+        logger.warning("Neo4j warmup failed: %s", exc)
+
+
 def close_driver() -> None:
     """
     Ferme proprement le driver à l'arrêt de l'application.
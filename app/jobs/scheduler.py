@@ -0,0 +1,296 @@
+# app/jobs/scheduler.py
+"""
+Planificateur de jobs de fond, démarré / arrêté par le lifespan de l'app.
+
+Suivi des modifications : les nœuds Article / Author / Topic portent un
+updated_at (timestamp() en ms, posé à l'ingestion). Chaque job garde un
+watermark dans Neo4j ((:JobState {name})) ; à chaque tick, les nœuds
+modifiés depuis ce watermark sont envoyés au job, exécuté dans un pool de
+processus (hors du chemin des requêtes), puis le watermark avance.
+
+Budgets :
+- JOBS_MAX_WORKERS : nombre de jobs exécutés en parallèle (taille du pool) ;
+- JOBS_CPU_BUDGET : fraction d'un cœur qu'un job peut consommer en moyenne.
+  Après un passage qui a coûté c secondes CPU, le job attend au moins
+  c / JOBS_CPU_BUDGET secondes avant le suivant ;
+- JOBS_NICE : priorité (nice) des processus du pool.
+
+Marge de sécurité : timestamp() est figé au début d'une transaction. Une
+écriture peut donc poser un updated_at inférieur à l'instant du tick mais
+n'être validée qu'après la lecture des nœuds modifiés. Chaque tick ne
+traite que les changements antérieurs à « maintenant - JOBS_WATERMARK_LAG_SECONDS »,
+et le watermark n'avance que jusque-là : ces écritures tardives restent
+au-dessus du watermark et sont prises au tick suivant.
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from app.database.neo4j import get_driver, read
+from app.jobs import tasks
+
+logger = logging.getLogger(__name__)
+
+JOBS_ENABLED = os.getenv("JOBS_ENABLED", "true").strip().lower() in ("1", "true", "yes", "on")
+JOBS_TICK_SECONDS = float(os.getenv("JOBS_TICK_SECONDS", "30"))
+JOBS_MAX_WORKERS = int(os.getenv("JOBS_MAX_WORKERS", "2"))
+JOBS_CPU_BUDGET = float(os.getenv("JOBS_CPU_BUDGET", "0.5"))
+JOBS_NICE = int(os.getenv("JOBS_NICE", "10"))
+JOBS_WATERMARK_LAG_SECONDS = float(os.getenv("JOBS_WATERMARK_LAG_SECONDS", "30"))
+
+# Propriété-clé des labels suivis
+TRACKED_LABELS = {
+    "Article": "id",
+    "Author": "id",
+    "Topic": "name",
+}
+
+
+class Job:
+    """
+    Un job incrémental : la fonction (dans app.jobs.tasks) reçoit les clés
+    modifiées des labels qu'il suit ; interval est le délai minimal entre
+    deux passages.
+    """
+
+    def __init__(self, name: str, func: Callable[[Dict[str, List[str]]], int], labels: List[str], interval: float):
+        self.name = name
+        self.func = func
+        self.labels = labels
+        self.interval = interval
+
+        self.watermark: Optional[int] = None
+        self.next_run = 0.0
+        self.running = False
+        self.runs = 0
+        self.failures = 0
+        self.backlog = 0
+        self.oldest_change: Optional[int] = None
+        self.last_run_at: Optional[float] = None
+        self.last_duration: Optional[float] = None
+        self.last_cpu: Optional[float] = None
+        self.last_processed: Optional[int] = None
+        self.last_error: Optional[str] = None
+
+    def metrics(self) -> dict:
+        now_ms = time.time() * 1000
+        staleness = (now_ms - self.oldest_change) / 1000 if self.oldest_change else 0.0
+        return {
+            "name": self.name,
+            "running": self.running,
+            "runs": self.runs,
+            "failures": self.failures,
+            "backlog": self.backlog,
+            "staleness_seconds": round(max(staleness, 0.0), 3),
+            "last_run_at": self.last_run_at,
+            "last_duration_seconds": self.last_duration,
+            "last_cpu_seconds": self.last_cpu,
+            "last_processed": self.last_processed,
+            "last_error": self.last_error,
+        }
+
+
+def default_jobs() -> List[Job]:
+    return [
+        Job("related_articles", tasks.related_articles, ["Article"], interval=60),
+        Job("topic_stats", tasks.topic_stats, ["Article", "Author", "Topic"], interval=60),
+    ]
+
+
+def _init_worker(nice: int) -> None:
+    # Les processus du pool passent après le serveur HTTP
+    if nice:
+        os.nice(nice)
+
+
+def _run_in_worker(func, dirty):
+    """
+    Exécuté dans un processus du pool : lance le job et mesure son temps CPU.
+    """
+    start = time.process_time()
+    processed = func(dirty)
+    return processed, time.process_time() - start
+
+
+def _read(query: str, **params) -> list:
+    with get_driver().session() as session:
+        return read(session, query, **params)
+
+
+def _write(query: str, **params) -> None:
+    with get_driver().session() as session:
+        session.execute_write(lambda tx: tx.run(query, **params).consume())
+
+
+class Scheduler:
+    def __init__(
+        self,
+        jobs: List[Job],
+        tick: float = JOBS_TICK_SECONDS,
+        max_workers: int = JOBS_MAX_WORKERS,
+        cpu_budget: float = JOBS_CPU_BUDGET,
+        nice: int = JOBS_NICE,
+        watermark_lag: float = JOBS_WATERMARK_LAG_SECONDS,
+    ):
+        self.jobs = {job.name: job for job in jobs}
+        self.tick = tick
+        self.max_workers = max_workers
+        self.cpu_budget = cpu_budget
+        self.nice = nice
+        self.watermark_lag_ms = int(watermark_lag * 1000)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._task: Optional[asyncio.Task] = None
+        self._running: Dict[str, asyncio.Task] = {}
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        # spawn : pas de fork d'un processus qui a déjà des threads (driver, serveur)
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.nice,),
+        )
+
+    async def start(self) -> None:
+        self._pool = self._new_pool()
+        self._task = asyncio.create_task(self._loop())
+        logger.info("Background scheduler started (%d jobs)", len(self.jobs))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        for task in list(self._running.values()):
+            task.cancel()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        logger.info("Background scheduler stopped")
+
+    def metrics(self) -> dict:
+        return {
+            "enabled": True,
+            "max_workers": self.max_workers,
+            "cpu_budget": self.cpu_budget,
+            "jobs": [job.metrics() for job in self.jobs.values()],
+        }
+
+    async def _loop(self) -> None:
+        while True:
+            # Premier tick après un délai : ne pas concurrencer le démarrage
+            await asyncio.sleep(self.tick)
+            try:
+                await self._tick()
+            except Exception:  # pylint: disable=broad-except
+                # Neo4j indisponible, etc. : on réessaie au tick suivant
+                logger.exception("Background scheduler tick failed")
+
+    async def _tick(self) -> None:
+        await self._load_watermarks()
+        now = time.monotonic()
+        for job in self.jobs.values():
+            if job.running or now < job.next_run:
+                continue
+            if len(self._running) >= self.max_workers:
+                break
+
+            db_now = (await run_in_threadpool(_read, "RETURN timestamp() AS now"))[0]["now"]
+            # Transactions encore en cours : leurs updated_at peuvent être < db_now
+            until = db_now - self.watermark_lag_ms
+            dirty = await run_in_threadpool(self._dirty_keys, job, until)
+            if not job.backlog:
+                job.next_run = now + job.interval
+                continue
+
+            job.running = True
+            self._running[job.name] = asyncio.create_task(self._run(job, dirty, until))
+
+    async def _load_watermarks(self) -> None:
+        if all(job.watermark is not None for job in self.jobs.values()):
+            return
+        records = await run_in_threadpool(
+            _read, "MATCH (s:JobState) RETURN s.name AS name, s.watermark AS watermark"
+        )
+        stored = {rec["name"]: rec["watermark"] for rec in records}
+        for job in self.jobs.values():
+            if job.watermark is None:
+                job.watermark = stored.get(job.name) or 0
+
+    def _dirty_keys(self, job: Job, until: int) -> Dict[str, List[str]]:
+        """
+        Clés des nœuds modifiés depuis le watermark du job (et au plus tard
+        à until), par label. Met à jour backlog et plus vieux changement.
+        """
+        dirty: Dict[str, List[str]] = {}
+        oldest: Optional[int] = None
+        for label in job.labels:
+            key = TRACKED_LABELS[label]
+            records = _read(
+                f"""
+                MATCH (n:{label})
+                WHERE n.updated_at > $since AND n.updated_at <= $until
+                RETURN n.{key} AS key, n.updated_at AS updated_at
+                """,
+                since=job.watermark,
+                until=until,
+            )
+            dirty[label] = [rec["key"] for rec in records]
+            for rec in records:
+                if oldest is None or rec["updated_at"] < oldest:
+                    oldest = rec["updated_at"]
+
+        job.backlog = sum(len(keys) for keys in dirty.values())
+        job.oldest_change = oldest
+        return dirty
+
+    async def _run(self, job: Job, dirty: Dict[str, List[str]], until: int) -> None:
+        loop = asyncio.get_running_loop()
+        start = time.monotonic()
+        try:
+            processed, cpu = await loop.run_in_executor(self._pool, _run_in_worker, job.func, dirty)
+            await run_in_threadpool(
+                _write,
+                "MERGE (s:JobState {name: $name}) SET s.watermark = $watermark",
+                name=job.name,
+                watermark=until,
+            )
+            job.watermark = until
+            job.backlog = 0
+            job.oldest_change = None
+            job.last_processed = processed
+            job.last_cpu = round(cpu, 3)
+            job.last_error = None
+            job.runs += 1
+            # Budget CPU : au plus cpu_budget cœur en moyenne pour ce job
+            cooldown = max(job.interval, cpu / self.cpu_budget) if self.cpu_budget > 0 else job.interval
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.exception("Background job %s failed", job.name)
+            if isinstance(exc, BrokenProcessPool):
+                # Un worker est mort (OOM, signal...) : le pool est inutilisable
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = self._new_pool()
+            job.failures += 1
+            job.last_error = repr(exc)
+            cooldown = job.interval
+        finally:
+            job.running = False
+            job.last_duration = round(time.monotonic() - start, 3)
+            job.last_run_at = time.time()
+            self._running.pop(job.name, None)
+
+        job.next_run = time.monotonic() + cooldown
+
+
+def create_scheduler() -> Optional[Scheduler]:
+    """
+    Renvoie le planificateur configuré, ou None si JOBS_ENABLED est faux.
+    """
+    if not JOBS_ENABLED:
+        return None
+    return Scheduler(default_jobs())
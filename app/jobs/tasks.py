@@ -0,0 +1,157 @@
+# app/jobs/tasks.py
+"""
+Jobs de précalcul incrémental, exécutés dans les processus du pool
+(voir app/jobs/scheduler.py). Chaque job reçoit les clés modifiées depuis
+son dernier passage, par label ({"Article": [...], "Topic": [...]}), et
+renvoie le nombre d'éléments recalculés.
+"""
+from typing import Dict, List
+
+from app.database.neo4j import get_driver, read
+
+CHUNK_SIZE = 500
+RELATED_TOP_K = 10
+RELATED_MIN_SCORE = 0.1
+
+
+def _chunks(items: List[str], size: int = CHUNK_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+ARTICLE_CANDIDATES = """
+UNWIND $ids AS id
+MATCH (a:Article {id: id})-[:HAS_TOPIC|HAS_TAG]->(f)<-[:HAS_TOPIC|HAS_TAG]-(other:Article)
+WHERE other <> a AND NOT (other)-[:DUPLICATE_OF]->(:Article)
+RETURN id, collect(DISTINCT other.id) AS candidates
+"""
+
+ARTICLE_FEATURES = """
+UNWIND $ids AS id
+MATCH (a:Article {id: id})
+OPTIONAL MATCH (a)-[:HAS_TOPIC|HAS_TAG]->(f)
+RETURN id, collect(labels(f)[0] + ':' + f.name) AS features
+"""
+
+WRITE_RELATED = """
+UNWIND $rows AS row
+MATCH (a:Article {id: row.id})
+OPTIONAL MATCH (a)-[old:RELATED_ARTICLE {computed: true}]->(o:Article)
+WHERE NOT o.id IN [r IN row.related | r.id]
+DELETE old
+WITH DISTINCT a, row
+UNWIND row.related AS rel
+MATCH (other:Article {id: rel.id})
+MERGE (a)-[r:RELATED_ARTICLE]->(other)
+  ON CREATE SET r.score = rel.score, r.computed = true
+  ON MATCH SET r.score = CASE WHEN r.computed THEN rel.score ELSE r.score END
+"""
+
+
+REVERSE_NEIGHBOURS = """
+UNWIND $ids AS id
+MATCH (other:Article)-[:RELATED_ARTICLE {computed: true}]->(:Article {id: id})
+RETURN DISTINCT other.id AS id
+"""
+
+
+def _candidates(session, ids: List[str]) -> Dict[str, List[str]]:
+    return {
+        rec["id"]: rec["candidates"]
+        for rec in read(session, ARTICLE_CANDIDATES, ids=ids)
+    }
+
+
+def _rescore(session, ids: List[str]) -> None:
+    candidates = _candidates(session, ids)
+    involved = set(ids).union(*candidates.values()) if candidates else set(ids)
+    features = {
+        rec["id"]: set(rec["features"])
+        for rec in read(session, ARTICLE_FEATURES, ids=list(involved))
+    }
+
+    rows = []
+    for article_id in ids:
+        own = features.get(article_id, set())
+        scored = []
+        for other_id in candidates.get(article_id, []):
+            other = features.get(other_id, set())
+            union = len(own | other)
+            score = len(own & other) / union if union else 0.0
+            if score >= RELATED_MIN_SCORE:
+                scored.append({"id": other_id, "score": round(score, 4)})
+        scored.sort(key=lambda r: (-r["score"], r["id"]))
+        rows.append({"id": article_id, "related": scored[:RELATED_TOP_K]})
+
+    session.execute_write(lambda tx: tx.run(WRITE_RELATED, rows=rows).consume())
+
+
+def related_articles(dirty: Dict[str, List[str]]) -> int:
+    """
+    Recalcule les RELATED_ARTICLE sortants des articles modifiés : score de
+    Jaccard sur les topics + tags partagés, top RELATED_TOP_K par article.
+    Les relations saisies à la main (sans computed: true) sont conservées.
+
+    Le score A→B dépend aussi des topics / tags de B : les voisins des
+    articles modifiés (candidats actuels et articles qui pointaient déjà
+    vers eux) sont recalculés avec eux.
+    """
+    article_ids = dirty.get("Article", [])
+    driver = get_driver()
+    with driver.session() as session:
+        targets = set(article_ids)
+        for ids in _chunks(article_ids):
+            for neighbours in _candidates(session, ids).values():
+                targets.update(neighbours)
+            targets.update(rec["id"] for rec in read(session, REVERSE_NEIGHBOURS, ids=ids))
+
+        for ids in _chunks(sorted(targets)):
+            _rescore(session, ids)
+
+    return len(targets)
+
+
+TOPICS_OF_CHANGES = """
+UNWIND $article_ids AS id
+MATCH (:Article {id: id})-[:HAS_TOPIC]->(t:Topic)
+RETURN DISTINCT t.name AS name
+UNION
+UNWIND $author_ids AS id
+MATCH (:Author {id: id})<-[:WRITTEN_BY]-(:Article)-[:HAS_TOPIC]->(t:Topic)
+RETURN DISTINCT t.name AS name
+"""
+
+WRITE_TOPIC_STATS = """
+UNWIND $names AS name
+MATCH (t:Topic {name: name})
+OPTIONAL MATCH (t)<-[:HAS_TOPIC]-(a:Article)
+OPTIONAL MATCH (a)-[:WRITTEN_BY]->(au:Author)
+OPTIONAL MATCH (t)-[:RELATED_TO_TOPIC]-(rt:Topic)
+WITH t, count(DISTINCT a) AS articles, count(DISTINCT au) AS authors, count(DISTINCT rt) AS related
+SET t.article_count = articles,
+    t.author_count = authors,
+    t.degree = articles + related
+"""
+
+
+def topic_stats(dirty: Dict[str, List[str]]) -> int:
+    """
+    Met à jour les statistiques des topics touchés (nombre d'articles,
+    d'auteurs, degré) : topics modifiés, topics des articles modifiés et
+    topics des articles des auteurs modifiés.
+    """
+    driver = get_driver()
+    with driver.session() as session:
+        names = set(dirty.get("Topic", []))
+        records = read(
+            session,
+            TOPICS_OF_CHANGES,
+            article_ids=dirty.get("Article", []),
+            author_ids=dirty.get("Author", []),
+        )
+        names.update(rec["name"] for rec in records)
+
+        for chunk in _chunks(sorted(names)):
+            session.execute_write(lambda tx: tx.run(WRITE_TOPIC_STATS, names=chunk).consume())
+
+    return len(names)
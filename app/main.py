@@ -1,23 +1,85 @@
 # app/main.py
+import os
+from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, Request
+from fastapi.responses import JSONResponse
 from neo4j import Session
+from neo4j.exceptions import ServiceUnavailable, SessionExpired, TransientError
+from starlette.concurrency import run_in_threadpool
 
-from app.database.neo4j import get_db, close_driver
+from app.database.neo4j import get_db, close_driver, warmup
+from app.profiling import install_profiling
+from app.jobs.scheduler import create_scheduler
 
 # Imports strong (pas besoin d'export dans app/routers/__init__.py)
-from app.routers.search import router as search_router
-from app.routers.articles import router as articles_router
-from app.routers.topics import router as topics_router
-from app.routers.authors import router as authors_router
+from app.routers.search import router as search_router, WARMUP_QUERIES as search_queries
+from app.routers.articles import router as articles_router, WARMUP_QUERIES as articles_queries
+from app.routers.topics import router as topics_router, WARMUP_QUERIES as topics_queries
+from app.routers.authors import router as authors_router, WARMUP_QUERIES as authors_queries
+from app.routers.clusters import router as clusters_router, WARMUP_QUERIES as clusters_queries
+from app.routers.query import router as query_router, WARMUP_QUERIES as query_queries
+from app.routers.jobs import router as jobs_router
+
+# Requêtes Cypher des routers, planifiées par Neo4j avant de servir
+WARMUP_QUERIES = (
+    search_queries
+    + articles_queries
+    + topics_queries
+    + authors_queries
+    + clusters_queries
+    + query_queries
+)
+
+NEO4J_WARMUP = os.getenv("NEO4J_WARMUP", "true").strip().lower() in ("1", "true", "yes", "on")
+
+
+@asynccontextmanager
+async def lifespan(application: FastAPI):
+    """
+    Préchauffe le pool Neo4j (si NEO4J_WARMUP), démarre le planificateur de
+    jobs de fond (si JOBS_ENABLED) et ferme proprement le driver à l'arrêt
+    de l'application.
+    """
+    if NEO4J_WARMUP:
+        await run_in_threadpool(warmup, WARMUP_QUERIES)
+
+    scheduler = create_scheduler()
+    application.state.scheduler = scheduler
+    if scheduler is not None:
+        await scheduler.start()
+    try:
+        yield
+    finally:
+        if scheduler is not None:
+            await scheduler.stop()
+        close_driver()
+
 
 app = FastAPI(
     title="Knowledge Graph / Wiki API",
     description="API pour le projet de Knowledge Graph (Articles, Topics, Authors, Tags, ...)",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 
+@app.exception_handler(ServiceUnavailable)
+@app.exception_handler(SessionExpired)
+@app.exception_handler(TransientError)
+async def neo4j_unavailable_handler(request: Request, exc: Exception):
+    """
+    Erreurs Neo4j transitoires encore présentes après les nouvelles
+    tentatives de execute_read (NEO4J_MAX_RETRY_TIME) : 503 plutôt que 500,
+    le client peut réessayer.
+    """
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Database temporarily unavailable."},
+        headers={"Retry-After": "1"},
+    )
+
+
 @app.get("/health", tags=["health"])
 def health_check(db: Session = Depends(get_db)):
     result = db.run("RETURN 1 AS ok").single()
@@ -25,13 +87,14 @@ def health_check(db: Session = Depends(get_db)):
     return {"status": "ok", "neo4j": "up" if db_ok else "down"}
 
 
+# Profilage à la demande (no-op si PROFILING_ENABLED est faux)
+install_profiling(app)
+
 # On enregistre les routes ici
 app.include_router(search_router)
 app.include_router(articles_router)
 app.include_router(topics_router)
 app.include_router(authors_router)
-
-
-@app.on_event("shutdown")
-def on_shutdown():
-    close_driver()
+app.include_router(clusters_router)
+app.include_router(query_router)
+app.include_router(jobs_router)
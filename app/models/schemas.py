@@ -64,3 +64,89 @@ class AuthorContributionsResponse(BaseModel):
     articles: List[Article] = []
     topics: List[Topic] = []
     tags: List[Tag] = []
+
+
+class ClusterInfo(BaseModel):
+    id: int
+    size: int
+
+
+class ClusterListResponse(BaseModel):
+    clusters: List[ClusterInfo]
+
+
+class ClusterSummaryResponse(ClusterInfo):
+    articles: List[Article] = []
+    topics: List[Topic] = []
+    authors: List[Author] = []
+
+
+# Composite query (/api/query) : sélection imbriquée article -> authors/topics -> ...
+
+class AuthorSelection(BaseModel):
+    articles: bool = False
+    topics: bool = False
+
+
+class TopicSelection(BaseModel):
+    related_topics: bool = False
+    articles: bool = False
+    authors: bool = False
+
+
+class ArticleSelection(BaseModel):
+    authors: Optional[AuthorSelection] = None
+    topics: Optional[TopicSelection] = None
+    tags: bool = False
+    related: Optional[int] = None  # nombre max d'articles liés
+
+
+class CompositeQueryRequest(BaseModel):
+    article_ids: List[str]
+    select: ArticleSelection = ArticleSelection()
+
+
+class AuthorNode(Author):
+    articles: Optional[List[Article]] = None
+    topics: Optional[List[Topic]] = None
+
+
+class TopicNode(Topic):
+    related_topics: Optional[List[Topic]] = None
+    articles: Optional[List[Article]] = None
+    authors: Optional[List[Author]] = None
+
+
+class ArticleNode(Article):
+    authors: Optional[List[AuthorNode]] = None
+    topics: Optional[List[TopicNode]] = None
+    tags: Optional[List[Tag]] = None
+    related: Optional[List[RelatedArticle]] = None
+
+
+class CompositeQueryResponse(BaseModel):
+    articles: List[ArticleNode]
+    missing: List[str] = []
+
+
+# Background jobs (/api/jobs)
+
+class JobMetrics(BaseModel):
+    name: str
+    running: bool
+    runs: int
+    failures: int
+    backlog: int
+    staleness_seconds: float
+    last_run_at: Optional[float] = None
+    last_duration_seconds: Optional[float] = None
+    last_cpu_seconds: Optional[float] = None
+    last_processed: Optional[int] = None
+    last_error: Optional[str] = None
+
+
+class JobsMetricsResponse(BaseModel):
+    enabled: bool
+    max_workers: Optional[int] = None
+    cpu_budget: Optional[float] = None
+    jobs: List[JobMetrics] = []
@@ -0,0 +1,293 @@
+# app/profiling.py
+"""
+Profilage à la demande des requêtes (opt-in).
+
+Activé par PROFILING_ENABLED=true. Une requête est profilée si elle porte
+l'en-tête PROFILING_HEADER avec la valeur PROFILING_TOKEN (en-tête ignoré
+si aucun token n'est défini) ou si elle est tirée au sort
+(PROFILING_SAMPLE_RATE, entre 0 et 1).
+
+Pour une requête profilée :
+- un échantillonneur (thread) relève la pile des threads de la requête
+  toutes les PROFILING_INTERVAL_MS millisecondes ;
+- des chronomètres mesurent les phases db / decode / model / serialize ;
+- la réponse porte un en-tête Server-Timing et un X-Profile-Id ;
+- les piles sont écrites dans PROFILING_OUTPUT_DIR au format
+  collapsed-stack (.folded) et speedscope (.speedscope.json).
+
+Si PROFILING_ENABLED est faux, rien n'est installé : ni middleware, ni
+enveloppe de route, et phase() renvoie un contexte vide partagé.
+"""
+import functools
+import hmac
+import inspect
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Dict, Optional, Set
+
+from fastapi import FastAPI, Request
+from fastapi.routing import APIRoute
+from starlette.concurrency import run_in_threadpool
+
+
+def _env_bool(name: str, default: bool = False) -> bool:
+    return os.getenv(name, str(default)).strip().lower() in ("1", "true", "yes", "on")
+
+
+PROFILING_ENABLED = _env_bool("PROFILING_ENABLED")
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+PROFILING_HEADER = os.getenv("PROFILING_HEADER", "X-Profile")
+PROFILING_TOKEN = os.getenv("PROFILING_TOKEN")
+PROFILING_INTERVAL_MS = float(os.getenv("PROFILING_INTERVAL_MS", "5"))
+PROFILING_OUTPUT_DIR = os.getenv("PROFILING_OUTPUT_DIR", "profiles")
+
+PHASES = ("db", "decode", "model", "serialize")
+
+_current_profile: ContextVar[Optional["RequestProfile"]] = ContextVar(
+    "current_profile", default=None
+)
+_NO_PHASE = nullcontext()
+
+
+class _Sampler(threading.Thread):
+    """
+    Échantillonneur de piles : relève périodiquement (sys._current_frames)
+    la pile des threads enregistrés par la requête profilée.
+    """
+
+    def __init__(self, profile: "RequestProfile", interval: float):
+        super().__init__(name="request-profiler", daemon=True)
+        self.profile = profile
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            frames = sys._current_frames()
+            for thread_id in list(self.profile.thread_ids):
+                frame = frames.get(thread_id)
+                if frame is None:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                # La boucle d'événements exécute aussi les autres requêtes
+                # en cours : ses piles sont étiquetées à part
+                if thread_id == self.profile.loop_thread:
+                    stack.append("event-loop (shared)")
+                else:
+                    stack.append(f"thread-{thread_id}")
+                self.samples[tuple(reversed(stack))] += 1
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+class RequestProfile:
+    """
+    État de profilage d'une requête : durées cumulées par phase,
+    threads à échantillonner et échantillonneur associé.
+    """
+
+    def __init__(self, name: str, interval: float):
+        self.id = uuid.uuid4().hex[:12]
+        self.name = name
+        self.durations: Dict[str, float] = {}
+        # Créé par le middleware, donc dans le thread de la boucle d'événements.
+        # Ce thread n'est échantillonné que pour un endpoint async.
+        self.loop_thread = threading.get_ident()
+        self.thread_ids: Set[int] = set()
+        self.endpoint_end: Optional[float] = None
+        self.sampler = _Sampler(self, interval)
+
+    @contextmanager
+    def phase(self, name: str):
+        thread_id = threading.get_ident()
+        if thread_id != self.loop_thread:
+            self.thread_ids.add(thread_id)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[name] = self.durations.get(name, 0.0) + time.perf_counter() - start
+
+    def server_timing(self, total: float) -> str:
+        timings = [(name, self.durations[name]) for name in PHASES if name in self.durations]
+        timings.append(("total", total))
+        return ", ".join(f"{name};dur={seconds * 1000:.2f}" for name, seconds in timings)
+
+    def write(self, output_dir: str) -> None:
+        """
+        Écrit les piles échantillonnées (collapsed-stack et speedscope).
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        base = os.path.join(output_dir, f"{time.strftime('%Y%m%d-%H%M%S')}-{self.name}-{self.id}")
+        samples = self.sampler.samples
+        interval = self.sampler.interval
+
+        with open(f"{base}.folded", "w", encoding="utf-8") as f:
+            for stack, count in samples.most_common():
+                f.write(f"{';'.join(stack)} {count}\n")
+
+        frame_index: Dict[str, int] = {}
+        frames, stacks, weights = [], [], []
+        for stack, count in samples.items():
+            indices = []
+            for frame in stack:
+                if frame not in frame_index:
+                    frame_index[frame] = len(frames)
+                    frames.append({"name": frame})
+                indices.append(frame_index[frame])
+            stacks.append(indices)
+            weights.append(count * interval)
+
+        speedscope = {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": self.name,
+            "exporter": "knowledge-graph-api",
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": self.name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": stacks,
+                    "weights": weights,
+                }
+            ],
+        }
+        with open(f"{base}.speedscope.json", "w", encoding="utf-8") as f:
+            json.dump(speedscope, f)
+
+
+def phase(name: str):
+    """
+    Chronomètre une phase (db, decode, model...) de la requête courante.
+    Sans profilage en cours, renvoie un contexte vide partagé.
+    Utilisation : with phase("db"): ...
+    """
+    profile = _current_profile.get()
+    if profile is None:
+        return _NO_PHASE
+    return profile.phase(name)
+
+
+class ProfiledRoute(APIRoute):
+    """
+    Classe de route qui, si le profilage est activé, enregistre le thread
+    de l'endpoint pour l'échantillonneur et mesure la sérialisation
+    (validation du response_model + encodage JSON) après l'endpoint.
+    Sans profilage, se comporte exactement comme APIRoute.
+    """
+
+    def __init__(self, path, endpoint, **kwargs):
+        if PROFILING_ENABLED:
+            endpoint = _mark_endpoint(endpoint)
+        super().__init__(path, endpoint, **kwargs)
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+        if not PROFILING_ENABLED:
+            return handler
+
+        async def profiled_handler(request: Request):
+            response = await handler(request)
+            profile = _current_profile.get()
+            if profile is not None and profile.endpoint_end is not None:
+                profile.durations["serialize"] = time.perf_counter() - profile.endpoint_end
+            return response
+
+        return profiled_handler
+
+
+def _mark_endpoint(endpoint):
+    """
+    Enveloppe l'endpoint pour noter l'instant où il rend la main.
+    """
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def async_wrapper(*args, **kwargs):
+            profile = _current_profile.get()
+            if profile is not None:
+                # Endpoint async : il tourne dans la boucle d'événements
+                profile.thread_ids.add(threading.get_ident())
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                _mark_endpoint_end()
+
+        return async_wrapper
+
+    @functools.wraps(endpoint)
+    def wrapper(*args, **kwargs):
+        profile = _current_profile.get()
+        if profile is not None:
+            # Les endpoints synchrones tournent dans le threadpool
+            profile.thread_ids.add(threading.get_ident())
+        try:
+            return endpoint(*args, **kwargs)
+        finally:
+            _mark_endpoint_end()
+
+    return wrapper
+
+
+def _mark_endpoint_end() -> None:
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.endpoint_end = time.perf_counter()
+
+
+def _should_profile(request: Request) -> bool:
+    # Sans token, l'en-tête est ignoré : n'importe quel client pourrait
+    # sinon lancer un échantillonneur et écrire des fichiers à chaque appel
+    value = request.headers.get(PROFILING_HEADER)
+    if value is not None and PROFILING_TOKEN:
+        return hmac.compare_digest(value, PROFILING_TOKEN)
+    return PROFILING_SAMPLE_RATE > 0 and random.random() < PROFILING_SAMPLE_RATE
+
+
+def install_profiling(app: FastAPI) -> None:
+    """
+    Ajoute le middleware de profilage, uniquement si PROFILING_ENABLED.
+    Les routes doivent utiliser ProfiledRoute (route_class de l'APIRouter).
+    """
+    if not PROFILING_ENABLED:
+        return
+
+    @app.middleware("http")
+    async def profiling_middleware(request: Request, call_next):
+        if not _should_profile(request):
+            return await call_next(request)
+
+        name = re.sub(r"[^A-Za-z0-9]+", "_", f"{request.method}{request.url.path}").strip("_")
+        profile = RequestProfile(name, PROFILING_INTERVAL_MS / 1000)
+        token = _current_profile.set(profile)
+        profile.sampler.start()
+        start = time.perf_counter()
+        try:
+            response = await call_next(request)
+        finally:
+            total = time.perf_counter() - start
+            profile.sampler.stop()
+            _current_profile.reset(token)
+
+        response.headers["Server-Timing"] = profile.server_timing(total)
+        response.headers["X-Profile-Id"] = profile.id
+        await run_in_threadpool(profile.write, PROFILING_OUTPUT_DIR)
+        return response
@@ -4,14 +4,15 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, Path, Query
 from neo4j import Session
 
-from app.database.neo4j import get_db
+from app.database.neo4j import get_db, read, read_single
+from app.profiling import ProfiledRoute, phase
 from app.models.schemas import (
     Article,
     RelatedArticle,
     RelatedArticlesResponse,
 )
 
-router = APIRouter(prefix="/api", tags=["articles"])
+router = APIRouter(prefix="/api", tags=["articles"], route_class=ProfiledRoute)
 
 
 def _node_to_article(node) -> Article:
@@ -25,6 +26,24 @@ def _node_to_article(node) -> Article:
     )
 
 
+ARTICLE_EXISTS_QUERY = "MATCH (a:Article {id: $article_id}) RETURN a LIMIT 1"
+
+RELATED_ARTICLES_QUERY = """
+MATCH (a:Article {id: $article_id})
+OPTIONAL MATCH (a)-[r:RELATED_ARTICLE]->(other:Article)
+WHERE NOT (other)-[:DUPLICATE_OF]->(:Article)
+RETURN other, r.score AS score
+ORDER BY score DESC
+LIMIT $limit
+"""
+
+# Requêtes planifiées au démarrage (voir app.database.neo4j.warmup)
+WARMUP_QUERIES = [
+    (ARTICLE_EXISTS_QUERY, {"article_id": ""}),
+    (RELATED_ARTICLES_QUERY, {"article_id": "", "limit": 10}),
+]
+
+
 @router.get(
     "/articles/{article_id}/related",
     response_model=RelatedArticlesResponse,
@@ -36,35 +55,30 @@ def get_related_articles(
 ):
     """
     Renvoie les articles liés à un article donné via la relation RELATED_ARTICLE.
+    Les doublons (DUPLICATE_OF, voir scripts/dedupe_articles.py) sont exclus.
     """
     # D'abord vérifier que l'article existe
-    exists_cypher = "MATCH (a:Article {id: $article_id}) RETURN a LIMIT 1"
-    record = db.run(exists_cypher, article_id=article_id).single()
+    record = read_single(db, ARTICLE_EXISTS_QUERY, article_id=article_id)
     if record is None:
         raise HTTPException(status_code=404, detail="Article not found.")
 
-    cypher = """
-    MATCH (a:Article {id: $article_id})
-    OPTIONAL MATCH (a)-[r:RELATED_ARTICLE]->(other:Article)
-    RETURN other, r.score AS score
-    ORDER BY score DESC
-    LIMIT $limit
-    """
+    records = read(db, RELATED_ARTICLES_QUERY, article_id=article_id, limit=limit)
 
-    records = db.run(cypher, article_id=article_id, limit=limit)
+    with phase("decode"):
+        rows = [(rec["other"], rec["score"]) for rec in records]
 
-    related_list: List[RelatedArticle] = []
-    for rec in records:
-        other_node = rec["other"]
-        # Il peut ne pas y avoir d'autres articles liés
-        if other_node is None:
-            continue
-        score = rec["score"] if rec["score"] is not None else 0.0
-        related_list.append(
-            RelatedArticle(
-                article=_node_to_article(other_node),
-                score=float(score),
+    with phase("model"):
+        related_list: List[RelatedArticle] = []
+        for other_node, score in rows:
+            # Il peut ne pas y avoir d'autres articles liés
+            if other_node is None:
+                continue
+            score = score if score is not None else 0.0
+            related_list.append(
+                RelatedArticle(
+                    article=_node_to_article(other_node),
+                    score=float(score),
+                )
             )
-        )
 
-    return RelatedArticlesResponse(article_id=article_id, related=related_list)
+        return RelatedArticlesResponse(article_id=article_id, related=related_list)
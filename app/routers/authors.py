@@ -4,7 +4,8 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, Path
 from neo4j import Session
 
-from app.database.neo4j import get_db
+from app.database.neo4j import get_db, read_single
+from app.profiling import ProfiledRoute, phase
 from app.models.schemas import (
     Author,
     Article,
@@ -13,7 +14,7 @@ from app.models.schemas import (
     AuthorContributionsResponse,
 )
 
-router = APIRouter(prefix="/api", tags=["authors"])
+router = APIRouter(prefix="/api", tags=["authors"], route_class=ProfiledRoute)
 
 
 def _node_to_author(node) -> Author:
@@ -48,6 +49,26 @@ def _node_to_tag(node) -> Tag:
     )
 
 
+AUTHOR_QUERY = "MATCH (a:Author {id: $id}) RETURN a LIMIT 1"
+
+AUTHOR_CONTRIBUTIONS_QUERY = """
+MATCH (au:Author {id: $id})
+OPTIONAL MATCH (au)<-[:WRITTEN_BY]-(art:Article)
+OPTIONAL MATCH (art)-[:HAS_TOPIC]->(t:Topic)
+OPTIONAL MATCH (art)-[:HAS_TAG]->(tag:Tag)
+RETURN
+    collect(DISTINCT art) AS articles,
+    collect(DISTINCT t)   AS topics,
+    collect(DISTINCT tag) AS tags
+"""
+
+# Requêtes planifiées au démarrage (voir app.database.neo4j.warmup)
+WARMUP_QUERIES = [
+    (AUTHOR_QUERY, {"id": ""}),
+    (AUTHOR_CONTRIBUTIONS_QUERY, {"id": ""}),
+]
+
+
 @router.get(
     "/authors/{author_id}/contributions",
     response_model=AuthorContributionsResponse,
@@ -64,45 +85,34 @@ def get_author_contributions(
     """
 
     # Vérifier que l'auteur existe
-    author_record = db.run(
-        "MATCH (a:Author {id: $id}) RETURN a LIMIT 1", id=author_id
-    ).single()
+    author_record = read_single(db, AUTHOR_QUERY, id=author_id)
     if author_record is None:
         raise HTTPException(status_code=404, detail="Author not found.")
 
     author_node = author_record["a"]
-    author = _node_to_author(author_node)
-
-    cypher = """
-    MATCH (au:Author {id: $id})
-    OPTIONAL MATCH (au)<-[:WRITTEN_BY]-(art:Article)
-    OPTIONAL MATCH (art)-[:HAS_TOPIC]->(t:Topic)
-    OPTIONAL MATCH (art)-[:HAS_TAG]->(tag:Tag)
-    RETURN
-        collect(DISTINCT art) AS articles,
-        collect(DISTINCT t)   AS topics,
-        collect(DISTINCT tag) AS tags
-    """
 
-    record = db.run(cypher, id=author_id).single()
-
-    article_nodes = record["articles"] or []
-    topic_nodes = record["topics"] or []
-    tag_nodes = record["tags"] or []
-
-    articles: List[Article] = [
-        _node_to_article(a) for a in article_nodes if a is not None
-    ]
-    topics: List[Topic] = [
-        _node_to_topic(t) for t in topic_nodes if t is not None
-    ]
-    tags: List[Tag] = [
-        _node_to_tag(t) for t in tag_nodes if t is not None
-    ]
-
-    return AuthorContributionsResponse(
-        author=author,
-        articles=articles,
-        topics=topics,
-        tags=tags,
-    )
+    record = read_single(db, AUTHOR_CONTRIBUTIONS_QUERY, id=author_id)
+
+    with phase("decode"):
+        article_nodes = record["articles"] or []
+        topic_nodes = record["topics"] or []
+        tag_nodes = record["tags"] or []
+
+    with phase("model"):
+        author = _node_to_author(author_node)
+        articles: List[Article] = [
+            _node_to_article(a) for a in article_nodes if a is not None
+        ]
+        topics: List[Topic] = [
+            _node_to_topic(t) for t in topic_nodes if t is not None
+        ]
+        tags: List[Tag] = [
+            _node_to_tag(t) for t in tag_nodes if t is not None
+        ]
+
+        return AuthorContributionsResponse(
+            author=author,
+            articles=articles,
+            topics=topics,
+            tags=tags,
+        )
@@ -0,0 +1,149 @@
+# app/routers/clusters.py
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, Response
+from neo4j import Session
+
+from app.database.neo4j import get_db, read, read_single
+from app.profiling import ProfiledRoute, phase
+from app.models.schemas import (
+    Article,
+    Author,
+    Topic,
+    ClusterInfo,
+    ClusterListResponse,
+    ClusterSummaryResponse,
+)
+
+router = APIRouter(prefix="/api", tags=["clusters"], route_class=ProfiledRoute)
+
+# Les résumés sont précalculés par scripts/detect_communities.py :
+# ils ne changent qu'à la prochaine exécution du job (nouveau run_id).
+CLUSTER_CACHE_CONTROL = "public, max-age=300"
+
+CLUSTERS_QUERY = """
+MATCH (c:Cluster)
+RETURN c.id AS id, c.size AS size
+ORDER BY size DESC, id
+LIMIT $limit
+"""
+
+CLUSTER_SUMMARY_QUERY = """
+MATCH (c:Cluster {id: $id})
+OPTIONAL MATCH (a:Article) WHERE a.id IN c.top_article_ids
+WITH c, collect(a) AS articles
+OPTIONAL MATCH (t:Topic) WHERE t.name IN c.top_topic_names
+WITH c, articles, collect(t) AS topics
+OPTIONAL MATCH (au:Author) WHERE au.id IN c.top_author_ids
+RETURN c, articles, topics, collect(au) AS authors
+"""
+
+# Requêtes planifiées au démarrage (voir app.database.neo4j.warmup)
+WARMUP_QUERIES = [
+    (CLUSTERS_QUERY, {"limit": 50}),
+    (CLUSTER_SUMMARY_QUERY, {"id": 0}),
+]
+
+
+def _node_to_article(node) -> Article:
+    return Article(
+        id=node.get("id"),
+        title=node.get("title"),
+        summary=node.get("summary"),
+        url=node.get("url"),
+        source=node.get("source"),
+        language=node.get("language"),
+    )
+
+
+def _node_to_topic(node) -> Topic:
+    return Topic(
+        name=node.get("name"),
+        description=node.get("description"),
+    )
+
+
+def _node_to_author(node) -> Author:
+    return Author(
+        id=node.get("id"),
+        name=node.get("name"),
+        affiliation=node.get("affiliation"),
+    )
+
+
+def _ordered(nodes, keys, key_property):
+    """
+    Remet les nœuds dans l'ordre du résumé (du plus central au moins central).
+    """
+    by_key = {n.get(key_property): n for n in nodes if n is not None}
+    return [by_key[k] for k in keys if k in by_key]
+
+
+@router.get("/clusters", response_model=ClusterListResponse)
+def list_clusters(
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_db),
+):
+    """
+    Liste les clusters (communautés) précalculés, du plus gros au plus petit.
+    """
+    records = read(db, CLUSTERS_QUERY, limit=limit)
+
+    with phase("decode"):
+        rows = [(rec["id"], rec["size"]) for rec in records]
+
+    with phase("model"):
+        clusters: List[ClusterInfo] = [
+            ClusterInfo(id=cid, size=size) for cid, size in rows
+        ]
+        return ClusterListResponse(clusters=clusters)
+
+
+@router.get(
+    "/clusters/{cluster_id}",
+    response_model=ClusterSummaryResponse,
+)
+def get_cluster(
+    request: Request,
+    response: Response,
+    cluster_id: int = Path(..., description="Cluster id (see scripts/detect_communities.py)"),
+    db: Session = Depends(get_db),
+):
+    """
+    Renvoie le résumé précalculé d'un cluster : top articles, topics et auteurs.
+    Réponse cacheable (ETag = identifiant de l'exécution du job).
+    """
+    record = read_single(db, CLUSTER_SUMMARY_QUERY, id=cluster_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Cluster not found.")
+
+    cluster_node = record["c"]
+    cache_headers = {
+        "ETag": f'"{cluster_node.get("run_id")}-{cluster_id}"',
+        "Cache-Control": CLUSTER_CACHE_CONTROL,
+    }
+    if request.headers.get("if-none-match") == cache_headers["ETag"]:
+        return Response(status_code=304, headers=cache_headers)
+    response.headers.update(cache_headers)
+
+    with phase("model"):
+        articles: List[Article] = [
+            _node_to_article(n)
+            for n in _ordered(record["articles"] or [], cluster_node.get("top_article_ids") or [], "id")
+        ]
+        topics: List[Topic] = [
+            _node_to_topic(n)
+            for n in _ordered(record["topics"] or [], cluster_node.get("top_topic_names") or [], "name")
+        ]
+        authors: List[Author] = [
+            _node_to_author(n)
+            for n in _ordered(record["authors"] or [], cluster_node.get("top_author_ids") or [], "id")
+        ]
+
+        return ClusterSummaryResponse(
+            id=cluster_id,
+            size=cluster_node.get("size"),
+            articles=articles,
+            topics=topics,
+            authors=authors,
+        )
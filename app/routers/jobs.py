@@ -0,0 +1,21 @@
+# app/routers/jobs.py
+from fastapi import APIRouter, Request
+
+from app.profiling import ProfiledRoute
+from app.models.schemas import JobsMetricsResponse
+
+router = APIRouter(prefix="/api", tags=["jobs"], route_class=ProfiledRoute)
+
+
+@router.get("/jobs", response_model=JobsMetricsResponse)
+def get_jobs_metrics(request: Request):
+    """
+    Métriques des jobs de fond (voir app/jobs/scheduler.py) :
+    durée et coût CPU du dernier passage, backlog (éléments modifiés en
+    attente au dernier contrôle) et staleness (âge du plus vieux changement
+    non encore traité, en secondes).
+    """
+    scheduler = getattr(request.app.state, "scheduler", None)
+    if scheduler is None:
+        return JobsMetricsResponse(enabled=False)
+    return JobsMetricsResponse(**scheduler.metrics())
@@ -0,0 +1,210 @@
+# app/routers/query.py
+from typing import Dict, List
+
+from fastapi import APIRouter, Depends, HTTPException
+from neo4j import Session
+
+from app.database.neo4j import get_db
+from app.database.loaders import Loaders, WARMUP_QUERIES  # noqa: F401 (warmup au démarrage)
+from app.profiling import ProfiledRoute, phase
+from app.models.schemas import (
+    Article,
+    Author,
+    Topic,
+    Tag,
+    RelatedArticle,
+    AuthorNode,
+    TopicNode,
+    ArticleNode,
+    CompositeQueryRequest,
+    CompositeQueryResponse,
+)
+
+router = APIRouter(prefix="/api", tags=["query"], route_class=ProfiledRoute)
+
+MAX_ARTICLE_IDS = 50
+MAX_RELATED = 50
+
+
+def _node_to_article(node) -> Article:
+    return Article(
+        id=node.get("id"),
+        title=node.get("title"),
+        summary=node.get("summary"),
+        url=node.get("url"),
+        source=node.get("source"),
+        language=node.get("language"),
+    )
+
+
+def _node_to_author(node) -> Author:
+    return Author(
+        id=node.get("id"),
+        name=node.get("name"),
+        affiliation=node.get("affiliation"),
+    )
+
+
+def _node_to_topic(node) -> Topic:
+    return Topic(
+        name=node.get("name"),
+        description=node.get("description"),
+    )
+
+
+def _node_to_tag(node) -> Tag:
+    return Tag(name=node.get("name"))
+
+
+def _unique(groups, key_property: str) -> List:
+    """
+    Aplatit des listes de nœuds en supprimant les doublons (ordre conservé).
+    """
+    seen: Dict[str, object] = {}
+    for group in groups:
+        for node in group:
+            seen.setdefault(node.get(key_property), node)
+    return list(seen.values())
+
+
+@router.post(
+    "/query",
+    response_model=CompositeQueryResponse,
+    response_model_exclude_unset=True,
+)
+def composite_query(
+    body: CompositeQueryRequest,
+    db: Session = Depends(get_db),
+):
+    """
+    Requête composite : résout en un seul appel une sélection imbriquée
+    article -> authors (articles, topics) / topics (related_topics, articles,
+    authors) / tags / related.
+
+    Les lectures sont regroupées niveau par niveau : à chaque niveau, toutes
+    les recherches par id d'un même type partent en une seule requête
+    `UNWIND $ids` (DataLoader), avec mémorisation pour la durée de la requête.
+    Seuls les champs sélectionnés apparaissent dans la réponse.
+    """
+    if not body.article_ids or len(body.article_ids) > MAX_ARTICLE_IDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"'article_ids' must contain between 1 and {MAX_ARTICLE_IDS} ids.",
+        )
+    select = body.select
+    if select.related is not None and not 1 <= select.related <= MAX_RELATED:
+        raise HTTPException(
+            status_code=400,
+            detail=f"'select.related' must be between 1 and {MAX_RELATED}.",
+        )
+
+    loaders = Loaders(db, related_limit=select.related or MAX_RELATED)
+
+    # Niveau 1 : les articles demandés
+    article_nodes = loaders.articles.load_many(body.article_ids)
+    article_ids = [i for i, node in article_nodes.items() if node is not None]
+    missing = [i for i, node in article_nodes.items() if node is None]
+
+    # Niveau 2 : relations directes des articles
+    authors_by_article = (
+        loaders.article_authors.load_many(article_ids) if select.authors else {}
+    )
+    topics_by_article = (
+        loaders.article_topics.load_many(article_ids) if select.topics else {}
+    )
+    tags_by_article = loaders.article_tags.load_many(article_ids) if select.tags else {}
+    related_by_article = (
+        loaders.article_related.load_many(article_ids) if select.related else {}
+    )
+
+    # Niveau 3 : relations des auteurs et des topics
+    author_sel, topic_sel = select.authors, select.topics
+    author_ids = [n.get("id") for n in _unique(authors_by_article.values(), "id")]
+    topic_names = [n.get("name") for n in _unique(topics_by_article.values(), "name")]
+
+    articles_by_author = (
+        loaders.author_articles.load_many(author_ids)
+        if author_sel and (author_sel.articles or author_sel.topics)
+        else {}
+    )
+    related_topics_by_topic = (
+        loaders.topic_related_topics.load_many(topic_names)
+        if topic_sel and topic_sel.related_topics
+        else {}
+    )
+    articles_by_topic = (
+        loaders.topic_articles.load_many(topic_names)
+        if topic_sel and (topic_sel.articles or topic_sel.authors)
+        else {}
+    )
+
+    # Niveau 4 : topics des auteurs et auteurs des topics, via leurs articles
+    # (les articles déjà chargés au niveau 2 sont servis par le cache)
+    if author_sel and author_sel.topics:
+        author_article_ids = [
+            n.get("id") for n in _unique(articles_by_author.values(), "id")
+        ]
+        loaders.article_topics.load_many(author_article_ids)
+    if topic_sel and topic_sel.authors:
+        topic_article_ids = [
+            n.get("id") for n in _unique(articles_by_topic.values(), "id")
+        ]
+        loaders.article_authors.load_many(topic_article_ids)
+
+    def build_author(node) -> AuthorNode:
+        fields = _node_to_author(node).dict()
+        author_articles = articles_by_author.get(node.get("id"), [])
+        if author_sel.articles:
+            fields["articles"] = [_node_to_article(a) for a in author_articles]
+        if author_sel.topics:
+            topics_map = loaders.article_topics.load_many(a.get("id") for a in author_articles)
+            fields["topics"] = [
+                _node_to_topic(t) for t in _unique(topics_map.values(), "name")
+            ]
+        return AuthorNode(**fields)
+
+    def build_topic(node) -> TopicNode:
+        fields = _node_to_topic(node).dict()
+        topic_articles = articles_by_topic.get(node.get("name"), [])
+        if topic_sel.related_topics:
+            fields["related_topics"] = [
+                _node_to_topic(t) for t in related_topics_by_topic.get(node.get("name"), [])
+            ]
+        if topic_sel.articles:
+            fields["articles"] = [_node_to_article(a) for a in topic_articles]
+        if topic_sel.authors:
+            authors_map = loaders.article_authors.load_many(a.get("id") for a in topic_articles)
+            fields["authors"] = [
+                _node_to_author(au) for au in _unique(authors_map.values(), "id")
+            ]
+        return TopicNode(**fields)
+
+    with phase("model"):
+        # Chaque auteur / topic n'est construit qu'une fois, même s'il est partagé
+        authors = {
+            n.get("id"): build_author(n) for n in _unique(authors_by_article.values(), "id")
+        }
+        topics = {
+            n.get("name"): build_topic(n) for n in _unique(topics_by_article.values(), "name")
+        }
+
+        results: List[ArticleNode] = []
+        for article_id in article_ids:
+            fields = _node_to_article(article_nodes[article_id]).dict()
+            if author_sel:
+                fields["authors"] = [authors[n.get("id")] for n in authors_by_article[article_id]]
+            if topic_sel:
+                fields["topics"] = [topics[n.get("name")] for n in topics_by_article[article_id]]
+            if select.tags:
+                fields["tags"] = [_node_to_tag(t) for t in tags_by_article[article_id]]
+            if select.related:
+                fields["related"] = [
+                    RelatedArticle(
+                        article=_node_to_article(r["article"]),
+                        score=float(r["score"]),
+                    )
+                    for r in related_by_article[article_id]
+                ]
+            results.append(ArticleNode(**fields))
+
+        return CompositeQueryResponse(articles=results, missing=missing)
@@ -4,7 +4,8 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, Query
 from neo4j import Session
 
-from app.database.neo4j import get_db
+from app.database.neo4j import get_db, read
+from app.profiling import ProfiledRoute, phase
 from app.models.schemas import (
     Topic,
     Tag,
@@ -13,7 +14,7 @@ from app.models.schemas import (
     SearchResponse,
 )
 
-router = APIRouter(prefix="/api", tags=["search"])
+router = APIRouter(prefix="/api", tags=["search"], route_class=ProfiledRoute)
 
 
 def _node_to_article(node) -> Article:
@@ -38,6 +39,25 @@ def _node_to_tag(node) -> Tag:
     return Tag(name=node.get("name"))
 
 
+SEARCH_QUERY = """
+MATCH (a:Article)
+WHERE NOT (a)-[:DUPLICATE_OF]->(:Article)
+OPTIONAL MATCH (a)-[:HAS_TOPIC]->(t:Topic)
+OPTIONAL MATCH (a)-[:HAS_TAG]->(tag:Tag)
+WHERE toLower(a.title) CONTAINS toLower($q)
+   OR toLower(coalesce(a.summary, '')) CONTAINS toLower($q)
+   OR toLower(coalesce(t.name, '')) CONTAINS toLower($q)
+   OR toLower(coalesce(tag.name, '')) CONTAINS toLower($q)
+RETURN a,
+       collect(DISTINCT t)   AS topics,
+       collect(DISTINCT tag) AS tags
+LIMIT $limit
+"""
+
+# Requêtes planifiées au démarrage (voir app.database.neo4j.warmup)
+WARMUP_QUERIES = [(SEARCH_QUERY, {"q": "", "limit": 10})]
+
+
 @router.get("/search", response_model=SearchResponse)
 def search_articles(
     q: str = Query(..., description="Search query string"),
@@ -46,42 +66,32 @@ def search_articles(
 ):
     """
     Recherche simple dans les titres / résumés / topics / tags.
+    Les doublons (DUPLICATE_OF) sont exclus des résultats.
     """
     if not q.strip():
         raise HTTPException(status_code=400, detail="Query 'q' must not be empty.")
 
-    cypher = """
-    MATCH (a:Article)
-    OPTIONAL MATCH (a)-[:HAS_TOPIC]->(t:Topic)
-    OPTIONAL MATCH (a)-[:HAS_TAG]->(tag:Tag)
-    WHERE toLower(a.title) CONTAINS toLower($q)
-       OR toLower(coalesce(a.summary, '')) CONTAINS toLower($q)
-       OR toLower(coalesce(t.name, '')) CONTAINS toLower($q)
-       OR toLower(coalesce(tag.name, '')) CONTAINS toLower($q)
-    RETURN a,
-           collect(DISTINCT t)   AS topics,
-           collect(DISTINCT tag) AS tags
-    LIMIT $limit
-    """
-
-    records = db.run(cypher, q=q, limit=limit)
-
-    results: List[ArticleWithContext] = []
-    for record in records:
-        article_node = record["a"]
-        topic_nodes = record["topics"] or []
-        tag_nodes = record["tags"] or []
-
-        article = _node_to_article(article_node)
-        topics = [_node_to_topic(t) for t in topic_nodes if t is not None]
-        tags = [_node_to_tag(t) for t in tag_nodes if t is not None]
-
-        results.append(
-            ArticleWithContext(
-                **article.dict(),
-                topics=topics,
-                tags=tags,
+    records = read(db, SEARCH_QUERY, q=q, limit=limit)
+
+    with phase("decode"):
+        rows = [
+            (record["a"], record["topics"] or [], record["tags"] or [])
+            for record in records
+        ]
+
+    with phase("model"):
+        results: List[ArticleWithContext] = []
+        for article_node, topic_nodes, tag_nodes in rows:
+            article = _node_to_article(article_node)
+            topics = [_node_to_topic(t) for t in topic_nodes if t is not None]
+            tags = [_node_to_tag(t) for t in tag_nodes if t is not None]
+
+            results.append(
+                ArticleWithContext(
+                    **article.dict(),
+                    topics=topics,
+                    tags=tags,
+                )
             )
-        )
 
-    return SearchResponse(query=q, results=results)
+        return SearchResponse(query=q, results=results)
@@ -4,7 +4,8 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, Path, Query
 from neo4j import Session
 
-from app.database.neo4j import get_db
+from app.database.neo4j import get_db, read_single
+from app.profiling import ProfiledRoute, phase
 from app.models.schemas import (
     Topic,
     Article,
@@ -12,7 +13,7 @@ from app.models.schemas import (
     TopicGraphResponse,
 )
 
-router = APIRouter(prefix="/api", tags=["topics"])
+router = APIRouter(prefix="/api", tags=["topics"], route_class=ProfiledRoute)
 
 
 def _node_to_topic(node) -> Topic:
@@ -41,6 +42,26 @@ def _node_to_author(node) -> Author:
     )
 
 
+TOPIC_QUERY = "MATCH (t:Topic {name: $name}) RETURN t LIMIT 1"
+
+TOPIC_GRAPH_QUERY = """
+MATCH (t:Topic {name: $name})
+OPTIONAL MATCH (t)-[:RELATED_TO_TOPIC]-(rt:Topic)
+OPTIONAL MATCH (t)<-[:HAS_TOPIC]-(a:Article)
+OPTIONAL MATCH (a)-[:WRITTEN_BY]->(au:Author)
+RETURN
+    collect(DISTINCT rt)  AS related_topics,
+    collect(DISTINCT a)   AS articles,
+    collect(DISTINCT au)  AS authors
+"""
+
+# Requêtes planifiées au démarrage (voir app.database.neo4j.warmup)
+WARMUP_QUERIES = [
+    (TOPIC_QUERY, {"name": ""}),
+    (TOPIC_GRAPH_QUERY, {"name": ""}),
+]
+
+
 @router.get(
     "/topics/{topic_id}/graph",
     response_model=TopicGraphResponse,
@@ -60,45 +81,34 @@ def get_topic_graph(
     """
 
     # Vérifier l'existence du topic
-    topic_record = db.run(
-        "MATCH (t:Topic {name: $name}) RETURN t LIMIT 1", name=topic_id
-    ).single()
+    topic_record = read_single(db, TOPIC_QUERY, name=topic_id)
     if topic_record is None:
         raise HTTPException(status_code=404, detail="Topic not found.")
 
     topic_node = topic_record["t"]
-    topic = _node_to_topic(topic_node)
-
-    cypher = """
-    MATCH (t:Topic {name: $name})
-    OPTIONAL MATCH (t)-[:RELATED_TO_TOPIC]-(rt:Topic)
-    OPTIONAL MATCH (t)<-[:HAS_TOPIC]-(a:Article)
-    OPTIONAL MATCH (a)-[:WRITTEN_BY]->(au:Author)
-    RETURN
-        collect(DISTINCT rt)  AS related_topics,
-        collect(DISTINCT a)   AS articles,
-        collect(DISTINCT au)  AS authors
-    """
 
-    record = db.run(cypher, name=topic_id).single()
-
-    related_topics_nodes = record["related_topics"] or []
-    article_nodes = record["articles"] or []
-    author_nodes = record["authors"] or []
-
-    related_topics: List[Topic] = [
-        _node_to_topic(n) for n in related_topics_nodes if n is not None
-    ]
-    articles: List[Article] = [
-        _node_to_article(n) for n in article_nodes if n is not None
-    ]
-    authors: List[Author] = [
-        _node_to_author(n) for n in author_nodes if n is not None
-    ]
-
-    return TopicGraphResponse(
-        topic=topic,
-        related_topics=related_topics,
-        articles=articles,
-        authors=authors,
-    )
+    record = read_single(db, TOPIC_GRAPH_QUERY, name=topic_id)
+
+    with phase("decode"):
+        related_topics_nodes = record["related_topics"] or []
+        article_nodes = record["articles"] or []
+        author_nodes = record["authors"] or []
+
+    with phase("model"):
+        topic = _node_to_topic(topic_node)
+        related_topics: List[Topic] = [
+            _node_to_topic(n) for n in related_topics_nodes if n is not None
+        ]
+        articles: List[Article] = [
+            _node_to_article(n) for n in article_nodes if n is not None
+        ]
+        authors: List[Author] = [
+            _node_to_author(n) for n in author_nodes if n is not None
+        ]
+
+        return TopicGraphResponse(
+            topic=topic,
+            related_topics=related_topics,
+            articles=articles,
+            authors=authors,
+        )
@@ -0,0 +1,92 @@
+# scripts/benchmark_dedupe.py
+
+import argparse
+import time
+
+import numpy as np
+
+from dedupe_articles import NUM_PERM, THRESHOLD, find_duplicates
+from minhash import LSHIndex, MinHasher, shingles
+
+
+def exact_jaccard(text1, text2):
+    s1, s2 = shingles(text1), shingles(text2)
+    union = len(np.union1d(s1, s2))
+    return len(np.intersect1d(s1, s2)) / union if union else 1.0
+
+
+def synthetic_corpus(num_articles, duplicate_rate, edit_rate, words=60, seed=0):
+    """
+    Génère un corpus synthétique : des articles originaux (mots aléatoires)
+    et des copies légèrement modifiées (une proportion edit_rate de mots remplacés).
+    Renvoie (articles, family) où family[id] est l'id de l'article original.
+    """
+    rng = np.random.default_rng(seed)
+    vocabulary = [f"w{i}" for i in range(20_000)]
+
+    articles = []
+    family = {}
+    originals = []
+    for i in range(num_articles):
+        article_id = f"article-{i}"
+        if originals and rng.random() < duplicate_rate:
+            base_id, base_words = originals[rng.integers(len(originals))]
+            text_words = list(base_words)
+            for pos in np.flatnonzero(rng.random(len(text_words)) < edit_rate):
+                text_words[pos] = vocabulary[rng.integers(len(vocabulary))]
+            family[article_id] = base_id
+        else:
+            text_words = [vocabulary[j] for j in rng.integers(len(vocabulary), size=words)]
+            originals.append((article_id, text_words))
+            family[article_id] = article_id
+        articles.append((article_id, " ".join(text_words)))
+
+    return articles, family
+
+
+def main(num_articles, duplicate_rate, edit_rate, threshold):
+    articles, family = synthetic_corpus(num_articles, duplicate_rate, edit_rate)
+    texts = dict(articles)
+    planted = {a for a, base in family.items() if a != base}
+    # Vérité terrain : copies dont la similarité de Jaccard exacte avec
+    # l'original atteint le seuil (les autres ne sont pas censées être trouvées)
+    expected = {a for a in planted if exact_jaccard(texts[a], texts[family[a]]) >= threshold}
+    print(
+        f"[Benchmark] {num_articles} articles, {len(planted)} planted near-duplicates "
+        f"({edit_rate:.0%} words edited), {len(expected)} above threshold {threshold}"
+    )
+
+    hasher = MinHasher(num_perm=NUM_PERM)
+    index = LSHIndex(num_perm=NUM_PERM, threshold=threshold)
+
+    t0 = time.perf_counter()
+    _, duplicates = find_duplicates(articles, index, hasher, {})
+    elapsed = time.perf_counter() - t0
+
+    # Un lien est correct si le doublon et le canonique sont de la même famille
+    correct = sum(1 for d in duplicates if family[d["id"]] == family[d["canonical"]])
+    flagged = {d["id"] for d in duplicates}
+    precision = correct / len(duplicates) if duplicates else 1.0
+    recall = len(flagged & expected) / len(expected) if expected else 1.0
+
+    print(f"[Benchmark] LSH bands x rows:  {index.bands} x {index.rows}")
+    print(f"[Benchmark] Flagged:           {len(duplicates)}")
+    print(f"[Benchmark] Precision:         {precision:.3f}")
+    print(f"[Benchmark] Recall:            {recall:.3f}")
+    print(f"[Benchmark] Planted found:     {len(flagged & planted) / len(planted):.3f}"
+          if planted else "[Benchmark] Planted found:     -")
+    print(f"[Benchmark] Throughput:        {num_articles / elapsed:,.0f} articles/s "
+          f"({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark de la détection de doublons (MinHash + LSH) sur données synthétiques."
+    )
+    parser.add_argument("--articles", type=int, default=50_000)
+    parser.add_argument("--duplicate-rate", type=float, default=0.2)
+    parser.add_argument("--edit-rate", type=float, default=0.05)
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    args = parser.parse_args()
+
+    main(args.articles, args.duplicate_rate, args.edit_rate, args.threshold)
@@ -0,0 +1,178 @@
+# scripts/dedupe_articles.py
+
+import argparse
+import os
+import time
+
+import numpy as np
+from neo4j import GraphDatabase, basic_auth
+from dotenv import load_dotenv
+
+from minhash import MAX_HASH, LSHIndex, MinHasher, shingles
+
+
+NUM_PERM = 128
+THRESHOLD = 0.8
+WRITE_BATCH_SIZE = 5_000
+
+
+def get_driver():
+    """
+    Crée un driver Neo4j à partir des variables d'environnement.
+    (même logique que scripts/seed_data.py)
+    """
+    load_dotenv()
+
+    uri = os.getenv("NEO4J_URI", "bolt://neo4j:7687")
+    user = os.getenv("NEO4J_USER", "neo4j")
+    password = os.getenv("NEO4J_PASSWORD", "password")
+
+    driver = GraphDatabase.driver(uri, auth=basic_auth(user, password))
+    return driver
+
+
+def article_text(title, summary):
+    return f"{title or ''} {summary or ''}"
+
+
+def find_duplicates(articles, index, hasher, canonical_of):
+    """
+    Indexe incrémentalement les articles (id, texte) dans l'index LSH.
+    Chaque article est d'abord comparé aux articles déjà indexés : s'il a un
+    voisin au-dessus du seuil, il devient doublon du canonique de ce voisin.
+    canonical_of (id -> id canonique) est mis à jour sur place.
+    Les articles sans texte (aucun shingle) sont ignorés : leur signature
+    vide serait identique pour tous et les relierait deux à deux.
+    Renvoie (signatures, duplicates), prêts pour un UNWIND.
+    """
+    signatures = []
+    duplicates = []
+    for article_id, text in articles:
+        hashes = shingles(text)
+        if len(hashes) == 0:
+            continue
+        signature = hasher.signature(hashes)
+        matches = index.query(signature)
+        index.insert(article_id, signature)
+        signatures.append({"id": article_id, "minhash": signature.tolist()})
+
+        if matches:
+            best_id, similarity = matches[0]
+            canonical_of[article_id] = canonical_of[best_id]
+            duplicates.append(
+                {
+                    "id": article_id,
+                    "canonical": canonical_of[best_id],
+                    "similarity": similarity,
+                }
+            )
+        else:
+            canonical_of[article_id] = article_id
+
+    return signatures, duplicates
+
+
+def flag_duplicates(session, num_perm=NUM_PERM, threshold=THRESHOLD):
+    """
+    Étape d'ingestion : détecte les articles quasi-identiques (MinHash + LSH)
+    et les relie à leur article canonique par (:Article)-[:DUPLICATE_OF]->(:Article).
+
+    Les signatures sont stockées sur les articles (propriété minhash) : une
+    exécution suivante réindexe les signatures existantes sans les recalculer
+    et ne compare que les nouveaux articles (insertion incrémentale).
+    """
+    print("[Dedupe] Flagging near-duplicate articles...")
+    hasher = MinHasher(num_perm=num_perm)
+    index = LSHIndex(num_perm=num_perm, threshold=threshold)
+
+    records = session.run(
+        """
+        MATCH (a:Article)
+        OPTIONAL MATCH (a)-[:DUPLICATE_OF]->(c:Article)
+        RETURN a.id AS id, a.title AS title, a.summary AS summary,
+               a.minhash AS minhash, c.id AS canonical
+        ORDER BY a.id
+        """
+    )
+
+    # Articles déjà traités d'abord (ordre d'ingestion), nouveaux ensuite
+    canonical_of = {}
+    new_articles = []
+    empty_signatures = []
+    for rec in records:
+        if rec["minhash"] is not None and len(rec["minhash"]) == num_perm:
+            # Signature vide (tout à MAX_HASH) d'une version précédente
+            if min(rec["minhash"]) == MAX_HASH:
+                empty_signatures.append(rec["id"])
+                continue
+            index.insert(rec["id"], np.array(rec["minhash"], dtype=np.uint64))
+            canonical_of[rec["id"]] = rec["canonical"] or rec["id"]
+        else:
+            new_articles.append((rec["id"], article_text(rec["title"], rec["summary"])))
+
+    if empty_signatures:
+        # Ces articles sans texte avaient été reliés entre eux à tort
+        session.run(
+            """
+            UNWIND $ids AS id
+            MATCH (a:Article {id: id})
+            REMOVE a.minhash
+            SET a.updated_at = timestamp()
+            WITH a
+            MATCH (a)-[r:DUPLICATE_OF]-(:Article)
+            DELETE r
+            """,
+            ids=empty_signatures,
+        ).consume()
+
+    signatures, duplicates = find_duplicates(new_articles, index, hasher, canonical_of)
+
+    for start in range(0, len(signatures), WRITE_BATCH_SIZE):
+        session.run(
+            """
+            UNWIND $rows AS row
+            MATCH (a:Article {id: row.id})
+            SET a.minhash = row.minhash
+            """,
+            rows=signatures[start:start + WRITE_BATCH_SIZE],
+        ).consume()
+
+    for start in range(0, len(duplicates), WRITE_BATCH_SIZE):
+        session.run(
+            """
+            UNWIND $rows AS row
+            MATCH (dup:Article {id: row.id})
+            MATCH (canonical:Article {id: row.canonical})
+            MERGE (dup)-[r:DUPLICATE_OF]->(canonical)
+              ON CREATE SET r.similarity = row.similarity,
+                            dup.updated_at = timestamp()
+            """,
+            rows=duplicates[start:start + WRITE_BATCH_SIZE],
+        ).consume()
+
+    print(
+        f"[Dedupe] {len(signatures)} new articles indexed, "
+        f"{len(duplicates)} flagged as DUPLICATE_OF (index size: {len(index)})"
+    )
+    return duplicates
+
+
+def main(threshold=THRESHOLD):
+    driver = get_driver()
+    with driver.session() as session:
+        t0 = time.perf_counter()
+        flag_duplicates(session, threshold=threshold)
+        print(f"[Dedupe] Finished in {time.perf_counter() - t0:.2f}s")
+
+    driver.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Détection des articles quasi-identiques (MinHash + LSH)."
+    )
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="Similarité de Jaccard minimale pour un doublon")
+    args = parser.parse_args()
+
+    main(threshold=args.threshold)
@@ -0,0 +1,352 @@
+# scripts/detect_communities.py
+
+import argparse
+import os
+from array import array
+import time
+import uuid
+
+import numpy as np
+from neo4j import GraphDatabase, basic_auth
+from dotenv import load_dotenv
+
+
+# Labels pris en compte pour le clustering, avec leur propriété-clé
+NODE_LABELS = {
+    "Article": "id",
+    "Topic": "name",
+    "Tag": "name",
+}
+
+# Relations utilisées comme arêtes (non orientées) du graphe Article/Topic/Tag.
+# Le poids de RELATED_ARTICLE vient de son score, les autres valent 1.
+EDGE_QUERIES = [
+    """
+    MATCH (a:Article)-[:HAS_TOPIC]->(t:Topic)
+    RETURN 'Article' AS src_label, a.id AS src, 'Topic' AS dst_label, t.name AS dst, 1.0 AS weight
+    """,
+    """
+    MATCH (a:Article)-[:HAS_TAG]->(tag:Tag)
+    RETURN 'Article' AS src_label, a.id AS src, 'Tag' AS dst_label, tag.name AS dst, 1.0 AS weight
+    """,
+    """
+    MATCH (t1:Topic)-[:RELATED_TO_TOPIC]->(t2:Topic)
+    RETURN 'Topic' AS src_label, t1.name AS src, 'Topic' AS dst_label, t2.name AS dst, 1.0 AS weight
+    """,
+    """
+    MATCH (a1:Article)-[r:RELATED_ARTICLE]->(a2:Article)
+    RETURN 'Article' AS src_label, a1.id AS src, 'Article' AS dst_label, a2.id AS dst,
+           coalesce(r.score, 1.0) AS weight
+    """,
+]
+
+WRITE_BATCH_SIZE = 10_000
+
+
+def get_driver():
+    """
+    Crée un driver Neo4j à partir des variables d'environnement.
+    (même logique que scripts/seed_data.py)
+    """
+    load_dotenv()
+
+    uri = os.getenv("NEO4J_URI", "bolt://neo4j:7687")
+    user = os.getenv("NEO4J_USER", "neo4j")
+    password = os.getenv("NEO4J_PASSWORD", "password")
+
+    driver = GraphDatabase.driver(uri, auth=basic_auth(user, password))
+    return driver
+
+
+# Graphe en mémoire (tableaux creux)
+
+def build_csr(num_nodes, src, dst, weight):
+    """
+    Construit une matrice d'adjacence symétrique au format CSR à partir
+    d'une liste d'arêtes (src, dst, weight). Les arêtes en double sont sommées.
+    Renvoie (indptr, indices, data).
+    """
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    weight = np.asarray(weight, dtype=np.float64)
+
+    # Graphe non orienté : on ajoute les deux sens
+    rows = np.concatenate([src, dst])
+    cols = np.concatenate([dst, src])
+    data = np.concatenate([weight, weight])
+
+    # Fusion des doublons (ex: RELATED_TO_TOPIC stocké dans les deux sens)
+    keys = rows * num_nodes + cols
+    keys, inverse = np.unique(keys, return_inverse=True)
+    data = np.bincount(inverse, weights=data, minlength=len(keys))
+    rows = keys // num_nodes
+    cols = keys % num_nodes
+
+    indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=num_nodes), out=indptr[1:])
+    return indptr, cols, data
+
+
+def label_propagation(indptr, indices, data, max_iter=30, tol=1e-3, seed=42):
+    """
+    Label propagation pondérée, vectorisée sur la représentation CSR.
+
+    Chaque nœud prend le label le plus lourd parmi ses voisins (son propre
+    label compte avec le poids de son arête la plus forte, ce qui stabilise
+    la convergence). Les mises à jour sont semi-synchrones : à chaque
+    itération seule une moitié aléatoire des nœuds change de label, ce qui
+    évite les oscillations propres aux graphes bipartis (Article/Tag).
+
+    Renvoie un tableau de labels compacts 0..k-1, triés par taille décroissante.
+    """
+    num_nodes = len(indptr) - 1
+    labels = np.arange(num_nodes, dtype=np.int64)
+    if num_nodes == 0:
+        return labels
+
+    rng = np.random.default_rng(seed)
+    degrees = np.diff(indptr)
+    rows = np.repeat(np.arange(num_nodes, dtype=np.int64), degrees)
+
+    # Boucle sur soi-même : poids = arête la plus forte du nœud (1 si isolé)
+    self_weight = np.ones(num_nodes, dtype=np.float64)
+    has_edges = degrees > 0
+    self_weight[has_edges] = np.maximum.reduceat(data, indptr[:-1][has_edges])
+    all_rows = np.concatenate([rows, np.arange(num_nodes, dtype=np.int64)])
+    all_cols = np.concatenate([indices, np.arange(num_nodes, dtype=np.int64)])
+    all_data = np.concatenate([data, self_weight])
+
+    for _ in range(max_iter):
+        # Poids cumulé de chaque couple (nœud, label voisin) : tri des clés
+        # puis somme par segment de clés identiques
+        keys = all_rows * num_nodes + labels[all_cols]
+        order = np.argsort(keys)
+        keys = keys[order]
+        starts = np.flatnonzero(np.diff(keys, prepend=-1))
+        scores = np.add.reduceat(all_data[order], starts)
+        keys = keys[starts]
+        key_rows = keys // num_nodes
+
+        # Pour chaque nœud : label de score max. Les clés étant triées, le
+        # premier maximum d'un nœud est aussi son plus petit label à égalité.
+        # (chaque nœud a une boucle sur soi-même, donc tous les nœuds sont présents)
+        row_starts = np.flatnonzero(np.diff(key_rows, prepend=-1))
+        row_max = np.maximum.reduceat(scores, row_starts)
+        candidates = np.flatnonzero(scores == row_max[key_rows])
+        first = np.diff(key_rows[candidates], prepend=-1) != 0
+        new_labels = keys[candidates[first]] % num_nodes
+
+        # Convergence jugée sur tous les nœuds, pas seulement sur la moitié
+        # tirée au sort (qui peut ne pas bouger alors que l'autre bougerait)
+        pending = new_labels != labels
+        update = rng.random(num_nodes) < 0.5
+        changed = update & pending
+        labels[changed] = new_labels[changed]
+
+        if pending.sum() <= tol * num_nodes:
+            break
+
+    # Renumérotation : cluster 0 = le plus gros
+    uniques, compact, counts = np.unique(labels, return_inverse=True, return_counts=True)
+    rank = np.empty(len(uniques), dtype=np.int64)
+    rank[np.argsort(-counts, kind="stable")] = np.arange(len(uniques))
+    return rank[compact]
+
+
+# Lecture / écriture Neo4j
+
+def load_graph(session):
+    """
+    Charge les nœuds Article/Topic/Tag et leurs relations sous forme de tableaux.
+    Renvoie (nodes, src, dst, weight) où nodes est une liste de (label, key).
+    """
+    nodes = []
+    index = {}
+
+    for label, key in NODE_LABELS.items():
+        result = session.run(f"MATCH (n:{label}) RETURN n.{key} AS key")
+        for record in result:
+            index[(label, record["key"])] = len(nodes)
+            nodes.append((label, record["key"]))
+
+    # array.array plutôt que des listes : 8 octets par arête au lieu de ~36
+    src, dst, weight = array("q"), array("q"), array("d")
+    for query in EDGE_QUERIES:
+        for record in session.run(query):
+            s = index.get((record["src_label"], record["src"]))
+            d = index.get((record["dst_label"], record["dst"]))
+            if s is None or d is None or s == d:
+                continue
+            src.append(s)
+            dst.append(d)
+            weight.append(record["weight"])
+
+    print(f"[Clusters] Loaded {len(nodes)} nodes and {len(src)} edges")
+    return nodes, src, dst, weight
+
+
+def top_members(nodes, labels, indptr, data, label, k):
+    """
+    Pour chaque cluster, renvoie les k nœuds du label donné ayant le plus
+    fort degré pondéré (les plus « centraux » du cluster).
+    """
+    num_nodes = len(nodes)
+    rows = np.repeat(np.arange(num_nodes, dtype=np.int64), np.diff(indptr))
+    strength = np.bincount(rows, weights=data, minlength=num_nodes)
+
+    members = np.array(
+        [i for i, (node_label, _) in enumerate(nodes) if node_label == label],
+        dtype=np.int64,
+    )
+    members = members[np.lexsort((-strength[members], labels[members]))]
+
+    top = {}
+    for i in members:
+        bucket = top.setdefault(int(labels[i]), [])
+        if len(bucket) < k:
+            bucket.append(nodes[i][1])
+    return top
+
+
+def top_authors(pairs, nodes, labels, k=10):
+    """
+    Pour chaque cluster, renvoie les k auteurs ayant écrit le plus d'articles
+    du cluster (à égalité : ordre des ids). pairs : (article_id, author_id).
+    """
+    article_cluster = {
+        node_key: int(labels[i])
+        for i, (node_label, node_key) in enumerate(nodes)
+        if node_label == "Article"
+    }
+    counts = {}
+    for article_id, author_id in pairs:
+        cluster_id = article_cluster.get(article_id)
+        if cluster_id is not None:
+            by_author = counts.setdefault(cluster_id, {})
+            by_author[author_id] = by_author.get(author_id, 0) + 1
+
+    return {
+        cluster_id: [a for a, _ in sorted(by_author.items(), key=lambda item: (-item[1], item[0]))[:k]]
+        for cluster_id, by_author in counts.items()
+    }
+
+
+def write_cluster_ids(session, nodes, labels):
+    """
+    Stocke l'id de cluster sur chaque nœud (propriété cluster_id), par lots.
+    """
+    for label, key in NODE_LABELS.items():
+        rows = [
+            {"key": node_key, "cluster": int(labels[i])}
+            for i, (node_label, node_key) in enumerate(nodes)
+            if node_label == label
+        ]
+        cypher = f"""
+        UNWIND $rows AS row
+        MATCH (n:{label} {{{key}: row.key}})
+        SET n.cluster_id = row.cluster
+        """
+        for start in range(0, len(rows), WRITE_BATCH_SIZE):
+            session.run(cypher, rows=rows[start:start + WRITE_BATCH_SIZE]).consume()
+
+
+def write_cluster_summaries(session, nodes, labels, indptr, data, top_k=10, min_size=2):
+    """
+    Crée un nœud (:Cluster) par cluster (taille >= min_size) avec un résumé
+    précalculé : top articles, top topics et top auteurs.
+    Les résumés des exécutions précédentes sont supprimés.
+    """
+    run_id = uuid.uuid4().hex
+    sizes = np.bincount(labels)
+    top_articles = top_members(nodes, labels, indptr, data, "Article", top_k)
+    top_topics = top_members(nodes, labels, indptr, data, "Topic", top_k)
+    # Calculés avant l'écriture : un Cluster porte le run_id (donc l'ETag de
+    # l'API) seulement une fois son résumé complet
+    pairs = session.run(
+        "MATCH (a:Article)-[:WRITTEN_BY]->(au:Author) RETURN a.id AS article, au.id AS author"
+    )
+    top_authors_by_cluster = top_authors(
+        ((rec["article"], rec["author"]) for rec in pairs), nodes, labels, top_k
+    )
+
+    rows = [
+        {
+            "id": cluster_id,
+            "size": int(size),
+            "top_article_ids": top_articles.get(cluster_id, []),
+            "top_topic_names": top_topics.get(cluster_id, []),
+            "top_author_ids": top_authors_by_cluster.get(cluster_id, []),
+        }
+        for cluster_id, size in enumerate(sizes)
+        if size >= min_size
+    ]
+
+    session.run(
+        """
+        CREATE CONSTRAINT cluster_id_unique IF NOT EXISTS
+        FOR (c:Cluster)
+        REQUIRE c.id IS UNIQUE
+        """
+    ).consume()
+
+    cypher = """
+    UNWIND $rows AS row
+    MERGE (c:Cluster {id: row.id})
+    SET c.size = row.size,
+        c.top_article_ids = row.top_article_ids,
+        c.top_topic_names = row.top_topic_names,
+        c.top_author_ids = row.top_author_ids,
+        c.run_id = $run_id,
+        c.computed_at = datetime()
+    """
+    for start in range(0, len(rows), WRITE_BATCH_SIZE):
+        session.run(cypher, rows=rows[start:start + WRITE_BATCH_SIZE], run_id=run_id).consume()
+
+    session.run(
+        "MATCH (c:Cluster) WHERE c.run_id <> $run_id DETACH DELETE c",
+        run_id=run_id,
+    ).consume()
+
+    print(f"[Clusters] Stored {len(rows)} cluster summaries (run {run_id})")
+
+
+def main(max_iter=30, top_k=10, min_size=2, fetch_size=10_000):
+    driver = get_driver()
+    with driver.session(fetch_size=fetch_size) as session:
+        t0 = time.perf_counter()
+        nodes, src, dst, weight = load_graph(session)
+
+        t1 = time.perf_counter()
+        indptr, indices, data = build_csr(len(nodes), src, dst, weight)
+        labels = label_propagation(indptr, indices, data, max_iter=max_iter)
+        num_clusters = int(labels.max()) + 1 if len(labels) else 0
+        print(
+            f"[Clusters] Found {num_clusters} clusters in "
+            f"{time.perf_counter() - t1:.2f}s (load: {t1 - t0:.2f}s)"
+        )
+
+        write_cluster_ids(session, nodes, labels)
+        write_cluster_summaries(
+            session, nodes, labels, indptr, data, top_k=top_k, min_size=min_size
+        )
+
+    driver.close()
+    print("[Clusters] Community detection finished.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Détection de communautés (label propagation) sur le graphe Article/Topic/Tag."
+    )
+    parser.add_argument("--max-iter", type=int, default=30)
+    parser.add_argument("--top-k", type=int, default=10, help="Taille des résumés par cluster")
+    parser.add_argument("--min-size", type=int, default=2, help="Taille minimale d'un cluster résumé")
+    parser.add_argument("--fetch-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    main(
+        max_iter=args.max_iter,
+        top_k=args.top_k,
+        min_size=args.min_size,
+        fetch_size=args.fetch_size,
+    )
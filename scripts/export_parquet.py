@@ -0,0 +1,199 @@
+# scripts/export_parquet.py
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from neo4j import GraphDatabase, basic_auth
+from dotenv import load_dotenv
+
+
+# Schéma colonnaire des nœuds : label -> (propriété-clé, colonnes)
+NODE_SPECS = {
+    "Article": (
+        "id",
+        {
+            "id": pa.string(),
+            "title": pa.string(),
+            "summary": pa.string(),
+            "url": pa.string(),
+            "source": pa.string(),
+            "language": pa.string(),
+            "cluster_id": pa.int64(),
+            "minhash": pa.list_(pa.int64()),
+        },
+    ),
+    "Author": (
+        "id",
+        {
+            "id": pa.string(),
+            "name": pa.string(),
+            "affiliation": pa.string(),
+        },
+    ),
+    "Topic": (
+        "name",
+        {
+            "name": pa.string(),
+            "description": pa.string(),
+            "cluster_id": pa.int64(),
+        },
+    ),
+    "Tag": (
+        "name",
+        {
+            "name": pa.string(),
+            "cluster_id": pa.int64(),
+        },
+    ),
+}
+
+# Relations : type -> (label source, label cible, propriétés de la relation)
+# Les extrémités sont identifiées par la propriété-clé de leur label.
+REL_SPECS = {
+    "HAS_TOPIC": ("Article", "Topic", {}),
+    "HAS_TAG": ("Article", "Tag", {}),
+    "WRITTEN_BY": ("Article", "Author", {}),
+    "RELATED_TO_TOPIC": ("Topic", "Topic", {}),
+    "RELATED_ARTICLE": ("Article", "Article", {"score": pa.float64()}),
+    "EXPERT_IN": ("Author", "Topic", {}),
+    "DUPLICATE_OF": ("Article", "Article", {"similarity": pa.float64()}),
+}
+
+
+def get_driver():
+    """
+    Crée un driver Neo4j à partir des variables d'environnement.
+    (même logique que scripts/seed_data.py)
+    """
+    load_dotenv()
+
+    uri = os.getenv("NEO4J_URI", "bolt://neo4j:7687")
+    user = os.getenv("NEO4J_USER", "neo4j")
+    password = os.getenv("NEO4J_PASSWORD", "password")
+
+    driver = GraphDatabase.driver(uri, auth=basic_auth(user, password))
+    return driver
+
+
+def node_schema(label):
+    _, columns = NODE_SPECS[label]
+    return pa.schema(list(columns.items()))
+
+
+def rel_schema(rel_type):
+    _, _, properties = REL_SPECS[rel_type]
+    return pa.schema([("src", pa.string()), ("dst", pa.string()), *properties.items()])
+
+
+def node_query(label):
+    _, columns = NODE_SPECS[label]
+    fields = ", ".join(f"n.{name} AS {name}" for name in columns)
+    return f"MATCH (n:{label}) RETURN {fields}"
+
+
+def rel_query(rel_type):
+    src_label, dst_label, properties = REL_SPECS[rel_type]
+    src_key, dst_key = NODE_SPECS[src_label][0], NODE_SPECS[dst_label][0]
+    fields = "".join(f", r.{name} AS {name}" for name in properties)
+    return (
+        f"MATCH (s:{src_label})-[r:{rel_type}]->(d:{dst_label}) "
+        f"RETURN s.{src_key} AS src, d.{dst_key} AS dst{fields}"
+    )
+
+
+def export_query(driver, query, schema, path, fetch_size, batch_size):
+    """
+    Exécute une requête en streaming et écrit le résultat dans un fichier
+    Parquet, par record batches de batch_size lignes : la mémoire reste
+    bornée (fetch_size records côté driver + un batch côté Arrow).
+    Renvoie le nombre de lignes écrites.
+    """
+    names = schema.names
+    rows = 0
+    columns = {name: [] for name in names}
+
+    with driver.session(fetch_size=fetch_size) as session, \
+            pq.ParquetWriter(path, schema, compression="zstd") as writer:
+
+        def flush():
+            if columns[names[0]]:
+                writer.write_batch(pa.RecordBatch.from_pydict(columns, schema=schema))
+                for values in columns.values():
+                    values.clear()
+
+        for record in session.run(query):
+            for name in names:
+                columns[name].append(record[name])
+            rows += 1
+            if rows % batch_size == 0:
+                flush()
+        flush()
+
+    return rows
+
+
+def main(output_dir="export", fetch_size=10_000, batch_size=50_000, workers=4):
+    os.makedirs(output_dir, exist_ok=True)
+    driver = get_driver()
+
+    jobs = {}
+    for label in NODE_SPECS:
+        jobs[f"nodes_{label}"] = (node_query(label), node_schema(label))
+    for rel_type in REL_SPECS:
+        jobs[f"rels_{rel_type}"] = (rel_query(rel_type), rel_schema(rel_type))
+
+    t0 = time.perf_counter()
+    # Un export par label / type de relation, en parallèle (une session chacun)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            name: pool.submit(
+                export_query,
+                driver,
+                query,
+                schema,
+                os.path.join(output_dir, f"{name}.parquet"),
+                fetch_size,
+                batch_size,
+            )
+            for name, (query, schema) in jobs.items()
+        }
+        counts = {name: future.result() for name, future in futures.items()}
+
+    driver.close()
+
+    manifest = {
+        "exported_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "files": {f"{name}.parquet": count for name, count in counts.items()},
+    }
+    with open(os.path.join(output_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+    for name, count in counts.items():
+        print(f"[Export] {name}: {count} rows")
+    print(f"[Export] Finished in {time.perf_counter() - t0:.2f}s -> {output_dir}/")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Export du knowledge graph en fichiers Parquet (un par label / type de relation)."
+    )
+    parser.add_argument("--output-dir", default="export")
+    parser.add_argument("--fetch-size", type=int, default=10_000,
+                        help="Records récupérés par aller-retour Bolt")
+    parser.add_argument("--batch-size", type=int, default=50_000,
+                        help="Lignes par record batch Arrow / row group Parquet")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="Exports exécutés en parallèle")
+    args = parser.parse_args()
+
+    main(
+        output_dir=args.output_dir,
+        fetch_size=args.fetch_size,
+        batch_size=args.batch_size,
+        workers=args.workers,
+    )
@@ -0,0 +1,199 @@
+# scripts/import_parquet.py
+
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pyarrow.parquet as pq
+
+from export_parquet import NODE_SPECS, REL_SPECS, get_driver
+from seed_data import clear_database, create_constraints_and_indexes, mark_updated
+
+
+def node_statement(label, mode):
+    key, _ = NODE_SPECS[label]
+    if mode == "merge":
+        return f"""
+        UNWIND $rows AS row
+        MERGE (n:{label} {{{key}: row.{key}}})
+        SET n += row
+        RETURN count(*) AS written
+        """
+    # Base vide : CREATE évite la recherche d'un nœud existant à chaque ligne
+    return f"""
+    UNWIND $rows AS row
+    CREATE (n:{label})
+    SET n = row
+    RETURN count(*) AS written
+    """
+
+
+def rel_statement(rel_type, mode):
+    src_label, dst_label, _ = REL_SPECS[rel_type]
+    src_key, dst_key = NODE_SPECS[src_label][0], NODE_SPECS[dst_label][0]
+    create = "MERGE" if mode == "merge" else "CREATE"
+    return f"""
+    UNWIND $rows AS row
+    MATCH (s:{src_label} {{{src_key}: row.src}})
+    MATCH (d:{dst_label} {{{dst_key}: row.dst}})
+    {create} (s)-[r:{rel_type}]->(d)
+    SET r += row.props
+    RETURN count(*) AS written
+    """
+
+
+COUNTERS = ("rows", "written", "nodes_created", "relationships_created", "properties_set")
+
+
+def _write_rows(tx, statement, rows):
+    """
+    Écrit un batch et renvoie ce que Neo4j a réellement écrit : lignes
+    passées par les MATCH (written) et compteurs du résumé.
+    """
+    result = tx.run(statement, rows=rows)
+    written = result.single()["written"]
+    counters = result.consume().counters
+    return {
+        "rows": len(rows),
+        "written": written,
+        "nodes_created": counters.nodes_created,
+        "relationships_created": counters.relationships_created,
+        "properties_set": counters.properties_set,
+    }
+
+
+def import_file(driver, path, statement, batch_size, to_rows=None):
+    """
+    Lit un fichier Parquet par record batches et écrit chaque batch en une
+    transaction UNWIND (execute_write : rejouée en cas d'erreur transitoire,
+    ex. deadlock entre imports parallèles). Renvoie les compteurs cumulés
+    (voir COUNTERS) : lignes lues et éléments réellement écrits.
+    """
+    totals = dict.fromkeys(COUNTERS, 0)
+    if not os.path.exists(path):
+        return totals
+
+    with driver.session() as session:
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size):
+            rows = batch.to_pylist()
+            if to_rows is not None:
+                rows = to_rows(rows)
+            for name, value in session.execute_write(_write_rows, statement, rows).items():
+                totals[name] += value
+    return totals
+
+
+def report(name, kind, totals):
+    """
+    Affiche les compteurs d'un fichier ; avertit si des lignes n'ont pas été
+    écrites (ex. relation dont une extrémité manque dans l'export : les
+    fichiers sont exportés à des instants différents et le MATCH l'écarte).
+    """
+    created = totals["nodes_created"] if kind == "nodes" else totals["relationships_created"]
+    print(
+        f"[Import] {name}: {totals['written']}/{totals['rows']} rows written, "
+        f"{created} {kind} created, {totals['properties_set']} properties set"
+    )
+    if totals["written"] < totals["rows"]:
+        print(f"[Import] WARNING {name}: {totals['rows'] - totals['written']} rows not written (missing endpoints?)")
+
+
+def _node_rows(rows):
+    # Propriétés absentes (null) : non écrites, comme dans la base d'origine
+    return [{name: value for name, value in row.items() if value is not None} for row in rows]
+
+
+def _rel_rows(properties):
+    def to_rows(rows):
+        return [
+            {
+                "src": row["src"],
+                "dst": row["dst"],
+                "props": {name: row[name] for name in properties if row[name] is not None},
+            }
+            for row in rows
+        ]
+
+    return to_rows
+
+
+def is_empty(session):
+    return session.run("MATCH (n) RETURN n LIMIT 1").single() is None
+
+
+def main(input_dir="export", mode="create", reset_db=False, batch_size=10_000, workers=4):
+    driver = get_driver()
+    with driver.session() as session:
+        if reset_db:
+            clear_database(session)
+        elif mode == "create" and not is_empty(session):
+            # Les batches parallèles déjà validés resteraient en place quand
+            # un autre échoue sur une contrainte d'unicité : import partiel
+            driver.close()
+            raise SystemExit(
+                "[Import] Database is not empty: use --reset to replace it "
+                "or --mode merge to import into it."
+            )
+        create_constraints_and_indexes(session)
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # 1. Nœuds : un label par worker
+        futures = {
+            label: pool.submit(
+                import_file,
+                driver,
+                os.path.join(input_dir, f"nodes_{label}.parquet"),
+                node_statement(label, mode),
+                batch_size,
+                _node_rows,
+            )
+            for label in NODE_SPECS
+        }
+        for label, future in futures.items():
+            report(label, "nodes", future.result())
+
+        # 2. Relations, une fois toutes les extrémités créées
+        futures = {
+            rel_type: pool.submit(
+                import_file,
+                driver,
+                os.path.join(input_dir, f"rels_{rel_type}.parquet"),
+                rel_statement(rel_type, mode),
+                batch_size,
+                _rel_rows(properties),
+            )
+            for rel_type, (_, _, properties) in REL_SPECS.items()
+        }
+        for rel_type, future in futures.items():
+            report(rel_type, "relationships", future.result())
+
+    # Les données dérivées (jobs de fond) sont recalculées après un import
+    with driver.session() as session:
+        mark_updated(session)
+
+    driver.close()
+    print(f"[Import] Finished in {time.perf_counter() - t0:.2f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Import rapide du knowledge graph depuis les fichiers Parquet de scripts/export_parquet.py."
+    )
+    parser.add_argument("--input-dir", default="export")
+    parser.add_argument("--mode", choices=("create", "merge"), default="create",
+                        help="create : base vide ou --reset (le plus rapide) ; merge : base existante")
+    parser.add_argument("--reset", action="store_true",
+                        help="Vide la base avant l'import (MATCH (n) DETACH DELETE n)")
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    main(
+        input_dir=args.input_dir,
+        mode=args.mode,
+        reset_db=args.reset,
+        batch_size=args.batch_size,
+        workers=args.workers,
+    )
@@ -0,0 +1,128 @@
+# scripts/minhash.py
+
+import re
+
+import numpy as np
+
+
+MAX_HASH = np.uint64((1 << 32) - 1)
+# Constante de hachage multiplicatif (Fibonacci hashing) sur 64 bits
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+
+_NON_WORD = re.compile(r"\W+")
+
+
+def shingles(text, k=5):
+    """
+    Hache les k-grammes (octets UTF-8) d'un texte normalisé (minuscules,
+    ponctuation retirée) en entiers 32 bits distincts, de façon vectorisée.
+    Les textes plus courts que k donnent un seul shingle.
+    """
+    normalized = _NON_WORD.sub(" ", (text or "").lower()).strip()
+    data = np.frombuffer(normalized.encode("utf-8"), dtype=np.uint8).astype(np.uint64)
+    if len(data) == 0:
+        return np.empty(0, dtype=np.uint64)
+
+    # Les k octets (k <= 8) de chaque fenêtre sont empaquetés dans un uint64,
+    # puis réduits à 32 bits par hachage multiplicatif.
+    width = max(len(data) - k + 1, 1)
+    packed = np.zeros(width, dtype=np.uint64)
+    for j in range(min(k, len(data))):
+        packed = (packed << np.uint64(8)) | data[j:j + width]
+    return np.unique((packed * _GOLDEN) >> np.uint64(32))
+
+
+class MinHasher:
+    """
+    Calcule des signatures MinHash de taille num_perm.
+    Deux signatures produites avec le même (num_perm, seed) sont comparables :
+    la proportion de composantes égales estime la similarité de Jaccard.
+    """
+
+    def __init__(self, num_perm=128, seed=1):
+        self.num_perm = num_perm
+        self.seed = seed
+        rng = np.random.default_rng(seed)
+        # Famille multiply-add-shift (Dietzfelbinger) : h(x) = ((a*x + b) mod 2^64) >> 32
+        # est 2-universelle pour x < 2^32 et ne demande ni division ni modulo.
+        self._a = rng.integers(0, 1 << 64, size=(num_perm, 1), dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 1 << 64, size=(num_perm, 1), dtype=np.uint64)
+
+    def signature(self, hashes):
+        """
+        Signature MinHash (np.ndarray d'entiers) d'un ensemble de shingles
+        hachés (voir shingles()).
+        """
+        if len(hashes) == 0:
+            return np.full(self.num_perm, MAX_HASH, dtype=np.uint64)
+
+        permuted = self._a * hashes
+        permuted += self._b
+        permuted >>= np.uint64(32)
+        return permuted.min(axis=1)
+
+
+def estimated_jaccard(sig1, sig2):
+    return float(np.count_nonzero(sig1 == sig2)) / len(sig1)
+
+
+def optimal_bands(num_perm, threshold, min_recall=0.95):
+    """
+    Choisit (bands, rows) avec bands * rows <= num_perm : le plus grand nombre
+    de lignes par bande (moins de faux positifs) tel que deux articles de
+    similarité égale au seuil restent candidats avec probabilité >= min_recall.
+    Les faux positifs sont ensuite filtrés par la similarité estimée.
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if 1.0 - (1.0 - threshold ** rows) ** bands >= min_recall:
+            best = (bands, rows)
+        else:
+            break
+    return best
+
+
+class LSHIndex:
+    """
+    Index LSH par bandes pour signatures MinHash.
+    Les insertions sont incrémentales : chaque signature est découpée en
+    bandes, chaque bande est un bucket (dict) ; deux articles sont candidats
+    s'ils partagent au moins un bucket.
+    """
+
+    def __init__(self, num_perm=128, threshold=0.8):
+        self.threshold = threshold
+        self.bands, self.rows = optimal_bands(num_perm, threshold)
+        self._buckets = [{} for _ in range(self.bands)]
+        self._signatures = {}
+
+    def __len__(self):
+        return len(self._signatures)
+
+    def _band_keys(self, signature):
+        for band in range(self.bands):
+            start = band * self.rows
+            yield band, signature[start:start + self.rows].tobytes()
+
+    def insert(self, key, signature):
+        self._signatures[key] = signature
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band].setdefault(band_key, []).append(key)
+
+    def query(self, signature):
+        """
+        Renvoie la liste (key, similarité estimée) des articles déjà indexés
+        dont la similarité dépasse le seuil, du plus proche au moins proche.
+        """
+        candidates = set()
+        for band, band_key in self._band_keys(signature):
+            candidates.update(self._buckets[band].get(band_key, ()))
+
+        matches = []
+        for key in candidates:
+            similarity = estimated_jaccard(signature, self._signatures[key])
+            if similarity >= self.threshold:
+                matches.append((key, similarity))
+        matches.sort(key=lambda m: (-m[1], m[0]))
+        return matches
@@ -4,6 +4,8 @@ import os
 from neo4j import GraphDatabase, basic_auth
 from dotenv import load_dotenv
 
+from dedupe_articles import flag_duplicates
+
 
 def get_driver():
     """
@@ -66,6 +68,22 @@ def create_constraints_and_indexes(session):
         CREATE INDEX tag_name_index IF NOT EXISTS
         FOR (tag:Tag)
         ON (tag.name)
+        """,
+        # Suivi des modifications (jobs de fond, voir app/jobs/scheduler.py)
+        """
+        CREATE INDEX article_updated_at_index IF NOT EXISTS
+        FOR (a:Article)
+        ON (a.updated_at)
+        """,
+        """
+        CREATE INDEX author_updated_at_index IF NOT EXISTS
+        FOR (au:Author)
+        ON (au.updated_at)
+        """,
+        """
+        CREATE INDEX topic_updated_at_index IF NOT EXISTS
+        FOR (t:Topic)
+        ON (t.updated_at)
         """
     ]
 
@@ -196,9 +214,24 @@ def seed_sample_data(session):
     """
 
     session.run(cypher)
+    mark_updated(session)
     print("[Neo4j] Sample data seeded successfully.")
 
 
+def mark_updated(session):
+    """
+    Pose updated_at (timestamp() en ms) sur les Articles / Authors / Topics :
+    les jobs de fond recalculent les données dérivées des nœuds modifiés.
+    """
+    session.run(
+        """
+        MATCH (n)
+        WHERE n:Article OR n:Author OR n:Topic
+        SET n.updated_at = timestamp()
+        """
+    ).consume()
+
+
 def main(reset_db: bool = True):
     driver = get_driver()
     with driver.session() as session:
@@ -207,6 +240,7 @@ def main(reset_db: bool = True):
 
         create_constraints_and_indexes(session)
         seed_sample_data(session)
+        flag_duplicates(session)
 
     driver.close()
     print("[Neo4j] Seeding finished.")
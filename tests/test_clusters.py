@@ -0,0 +1,80 @@
+# tests/test_clusters.py
+
+import itertools
+import os
+import sys
+
+from fastapi.testclient import TestClient
+from app.main import app
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+from detect_communities import build_csr, label_propagation, top_authors  # noqa: E402
+
+client = TestClient(app)
+
+
+def test_list_clusters():
+    # La liste peut être vide si scripts/detect_communities.py n'a pas tourné
+    response = client.get("/api/clusters")
+    assert response.status_code == 200
+
+    data = response.json()
+    assert isinstance(data["clusters"], list)
+
+    for cluster in data["clusters"]:
+        assert "id" in cluster
+        assert "size" in cluster
+
+
+def test_unknown_cluster_returns_404():
+    response = client.get("/api/clusters/999999999")
+    assert response.status_code == 404
+
+
+# Algorithme (scripts/detect_communities.py) : fonctions numpy pures, sans base
+
+
+def _clusters(num_nodes, edges, seed=42):
+    src = [s for s, _ in edges]
+    dst = [d for _, d in edges]
+    indptr, indices, data = build_csr(num_nodes, src, dst, [1.0] * len(edges))
+    return label_propagation(indptr, indices, data, seed=seed)
+
+
+def test_build_csr_merges_duplicate_edges():
+    # 0-1 stockée dans les deux sens + une fois en double
+    indptr, indices, data = build_csr(3, [0, 1, 0], [1, 0, 1], [1.0, 1.0, 0.5])
+
+    assert indptr.tolist() == [0, 1, 2, 2]
+    assert indices.tolist() == [1, 0]
+    assert data.tolist() == [2.5, 2.5]
+
+
+def test_clique_is_one_cluster():
+    edges = list(itertools.combinations(range(5), 2))
+    for seed in range(50):
+        assert set(_clusters(5, edges, seed=seed).tolist()) == {0}
+
+
+def test_disjoint_components_get_separate_labels():
+    for seed in range(50):
+        labels = _clusters(4, [(0, 1), (2, 3)], seed=seed)
+        assert labels[0] == labels[1]
+        assert labels[2] == labels[3]
+        assert labels[0] != labels[2]
+
+
+def test_top_authors_per_cluster():
+    nodes = [("Article", "a1"), ("Article", "a2"), ("Article", "a3"), ("Topic", "t")]
+    labels = [0, 0, 1, 0]
+    pairs = [
+        ("a1", "bob"), ("a2", "bob"), ("a2", "alice"),
+        ("a3", "carol"),
+        ("unknown", "dave"),
+    ]
+
+    top = top_authors(pairs, nodes, labels, k=10)
+
+    assert top == {0: ["bob", "alice"], 1: ["carol"]}
+    assert top_authors(pairs, nodes, labels, k=1)[0] == ["bob"]
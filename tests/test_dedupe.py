@@ -0,0 +1,110 @@
+# tests/test_dedupe.py
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+from dedupe_articles import article_text, find_duplicates  # noqa: E402
+from minhash import LSHIndex, MinHasher, estimated_jaccard, optimal_bands, shingles  # noqa: E402
+
+
+TEXT = (
+    "Neo4j is a graph database management system. Nodes, relationships and "
+    "properties are stored natively, and queries are written in Cypher."
+)
+OTHER_TEXT = (
+    "The quarterly budget review covers travel expenses, hiring plans and "
+    "office rent for the upcoming fiscal year."
+)
+
+
+def _find(articles, index=None, canonical_of=None):
+    canonical_of = {} if canonical_of is None else canonical_of
+    signatures, duplicates = find_duplicates(
+        articles,
+        index if index is not None else LSHIndex(num_perm=128, threshold=0.8),
+        MinHasher(num_perm=128),
+        canonical_of,
+    )
+    return signatures, duplicates, canonical_of
+
+
+def test_shingles_short_and_empty_text():
+    assert len(shingles("")) == 0
+    assert len(shingles(None)) == 0
+    assert len(shingles(" --- ")) == 0
+    # Plus court que k : un seul shingle
+    assert len(shingles("abc", k=5)) == 1
+    # 11 octets -> 7 fenêtres de 5, toutes distinctes ici
+    assert len(shingles("hello world", k=5)) == 7
+    # Normalisation : casse et ponctuation ignorées
+    assert shingles("Hello, World!").tolist() == shingles("hello world").tolist()
+
+
+def test_minhash_signatures():
+    hasher = MinHasher(num_perm=128)
+    sig = hasher.signature(shingles(TEXT))
+
+    assert sig.shape == (128,)
+    assert (hasher.signature(shingles(TEXT)) == sig).all()
+    assert (MinHasher(num_perm=128).signature(shingles(TEXT)) == sig).all()
+    assert estimated_jaccard(sig, hasher.signature(shingles(OTHER_TEXT))) < 0.1
+
+
+def test_optimal_bands():
+    bands, rows = optimal_bands(128, 0.8)
+    assert bands * rows <= 128
+    # Rappel garanti au seuil, et une ligne de plus par bande ne le garantit plus
+    assert 1 - (1 - 0.8 ** rows) ** bands >= 0.95
+    more = rows + 1
+    assert 1 - (1 - 0.8 ** more) ** (128 // more) < 0.95
+
+
+def test_lsh_index_is_incremental():
+    hasher = MinHasher(num_perm=128)
+    index = LSHIndex(num_perm=128, threshold=0.8)
+    sig = hasher.signature(shingles(TEXT))
+
+    assert index.query(sig) == []
+
+    index.insert("a", sig)
+    assert len(index) == 1
+    assert index.query(sig) == [("a", 1.0)]
+
+    near = hasher.signature(shingles(TEXT + " Updated."))
+    index.insert("b", near)
+    assert [key for key, _ in index.query(sig)] == ["a", "b"]
+    assert index.query(hasher.signature(shingles(OTHER_TEXT))) == []
+
+
+def test_find_duplicates_links_to_root_canonical():
+    hasher = MinHasher(num_perm=128)
+    index = LSHIndex(num_perm=128, threshold=0.8)
+    # "copy" est déjà doublon de "root" (exécution précédente)
+    index.insert("copy", hasher.signature(shingles(TEXT)))
+    canonical_of = {"root": "root", "copy": "root"}
+
+    signatures, duplicates, canonical_of = _find(
+        [("new", TEXT), ("other", OTHER_TEXT)], index=index, canonical_of=canonical_of
+    )
+
+    assert [s["id"] for s in signatures] == ["new", "other"]
+    assert duplicates == [{"id": "new", "canonical": "root", "similarity": 1.0}]
+    assert canonical_of["new"] == "root"
+    assert canonical_of["other"] == "other"
+
+
+def test_articles_without_text_are_skipped():
+    signatures, duplicates, canonical_of = _find(
+        [
+            ("a", article_text(None, None)),
+            ("b", article_text("", None)),
+            ("c", article_text("---", "")),
+            ("d", article_text("Graph databases", "An introduction to Neo4j")),
+        ]
+    )
+
+    assert duplicates == []
+    assert [s["id"] for s in signatures] == ["d"]
+    assert set(canonical_of) == {"d"}
@@ -0,0 +1,263 @@
+# tests/test_jobs.py
+
+import asyncio
+import re
+import time
+from concurrent.futures import Executor, Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.database.neo4j import get_driver
+from app.jobs import scheduler as scheduler_module
+from app.jobs import tasks
+from app.jobs.scheduler import Job, Scheduler
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_jobs_metrics():
+    response = client.get("/api/jobs")
+    assert response.status_code == 200
+
+    data = response.json()
+    assert isinstance(data["enabled"], bool)
+    assert isinstance(data["jobs"], list)
+
+    for job in data["jobs"]:
+        assert "backlog" in job
+        assert "staleness_seconds" in job
+        assert "last_duration_seconds" in job
+
+
+def test_lifespan_starts_scheduler(monkeypatch):
+    monkeypatch.setattr(main, "NEO4J_WARMUP", False)
+    monkeypatch.setattr(scheduler_module, "JOBS_ENABLED", True)
+
+    try:
+        with TestClient(app) as lifespan_client:
+            assert isinstance(app.state.scheduler, Scheduler)
+            response = lifespan_client.get("/api/jobs")
+    finally:
+        # Le lifespan ferme le driver partagé : les tests suivants en recréent un
+        get_driver.cache_clear()
+        app.state.scheduler = None
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["enabled"] is True
+    assert {job["name"] for job in data["jobs"]} == {"related_articles", "topic_stats"}
+
+
+# Planificateur : Neo4j (_read / _write) et pool de processus remplacés
+# par des doublures en mémoire
+
+class FakeGraph:
+    """
+    Nœuds {label: {key: updated_at}} et horloge Neo4j (timestamp(), en ms).
+    """
+
+    def __init__(self, now):
+        self.now = now
+        self.nodes = {}
+        self.writes = []
+
+    def read(self, query, **params):
+        if "timestamp()" in query:
+            return [{"now": self.now}]
+        if "JobState" in query:
+            return []
+        label = re.search(r"MATCH \(n:(\w+)\)", query).group(1)
+        return [
+            {"key": key, "updated_at": updated_at}
+            for key, updated_at in self.nodes.get(label, {}).items()
+            if params["since"] < updated_at <= params["until"]
+        ]
+
+    def write(self, query, **params):
+        self.writes.append(params)
+
+
+class InlineExecutor(Executor):
+    """
+    Exécute les jobs dans le thread appelant ; `error` simule un pool cassé.
+    """
+
+    def __init__(self, error=None):
+        self.error = error
+        self.shut_down = False
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        if self.error is not None:
+            future.set_exception(self.error)
+        else:
+            future.set_result(fn(*args, **kwargs))
+        return future
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        self.shut_down = True
+
+
+@pytest.fixture
+def graph(monkeypatch):
+    fake = FakeGraph(now=100_000)
+    monkeypatch.setattr(scheduler_module, "_read", fake.read)
+    monkeypatch.setattr(scheduler_module, "_write", fake.write)
+    return fake
+
+
+def _scheduler(job, pools, **kwargs):
+    sched = Scheduler([job], tick=1, max_workers=1, watermark_lag=30, **kwargs)
+    pools = iter(pools)
+    sched._new_pool = lambda: next(pools)
+    sched._pool = sched._new_pool()
+    return sched
+
+
+def _tick(sched):
+    async def run():
+        await sched._tick()
+        await asyncio.gather(*sched._running.values())
+
+    asyncio.run(run())
+
+
+def test_tick_processes_changes_and_advances_watermark(graph):
+    calls = []
+    job = Job("touched", lambda dirty: calls.append(dirty) or len(dirty["Article"]), ["Article"], interval=1)
+    sched = _scheduler(job, [InlineExecutor()])
+
+    # a2 est plus récent que la marge de sécurité (30 s) : pas encore traité
+    graph.nodes["Article"] = {"a1": 1_000, "a2": 90_000}
+    _tick(sched)
+
+    assert calls == [{"Article": ["a1"]}]
+    assert job.watermark == 70_000
+    assert graph.writes == [{"name": "touched", "watermark": 70_000}]
+    assert job.runs == 1 and job.backlog == 0 and job.last_processed == 1
+
+    # Tick suivant : seul a2 est au-dessus du watermark
+    graph.now = 200_000
+    job.next_run = 0
+    _tick(sched)
+
+    assert calls[-1] == {"Article": ["a2"]}
+    assert job.watermark == 170_000
+
+
+def test_tick_without_changes_skips_job(graph):
+    job = Job("idle", lambda dirty: pytest.fail("job should not run"), ["Article"], interval=60)
+    sched = _scheduler(job, [InlineExecutor()])
+
+    _tick(sched)
+
+    assert job.runs == 0
+    assert job.watermark == 0
+    assert job.next_run > time.monotonic() + 50
+
+
+def test_cpu_budget_sets_cooldown(graph, monkeypatch):
+    # 10 s CPU avec un budget de 0.5 cœur : au moins 20 s de pause
+    monkeypatch.setattr(scheduler_module, "_run_in_worker", lambda func, dirty: (1, 10.0))
+    job = Job("heavy", lambda dirty: 1, ["Article"], interval=1)
+    sched = _scheduler(job, [InlineExecutor()], cpu_budget=0.5)
+
+    graph.nodes["Article"] = {"a1": 1_000}
+    _tick(sched)
+
+    assert job.last_cpu == 10.0
+    assert job.next_run - time.monotonic() > 19
+
+
+def test_broken_pool_is_replaced(graph):
+    broken, fresh = InlineExecutor(error=BrokenProcessPool("worker died")), InlineExecutor()
+    job = Job("crashy", lambda dirty: 1, ["Article"], interval=1)
+    sched = _scheduler(job, [broken, fresh])
+
+    graph.nodes["Article"] = {"a1": 1_000}
+    _tick(sched)
+
+    assert job.failures == 1
+    assert "BrokenProcessPool" in job.last_error
+    assert broken.shut_down and sched._pool is fresh
+    # Watermark inchangé : les changements seront retraités
+    assert job.watermark == 0 and not graph.writes
+
+    job.next_run = 0
+    _tick(sched)
+    assert job.runs == 1 and job.watermark == 70_000
+
+
+# Job related_articles : session Neo4j en mémoire
+
+class FakeArticles:
+    """
+    Articles {id: features}, RELATED_ARTICLE calculées {(src, dst)} et
+    lignes écrites par WRITE_RELATED.
+    """
+
+    def __init__(self, features, related):
+        self.features = features
+        self.related = related
+        self.rows = []
+
+    def read(self, session, query, **params):
+        ids = params["ids"]
+        if query is tasks.ARTICLE_CANDIDATES:
+            return [
+                {
+                    "id": id_,
+                    "candidates": [o for o, f in self.features.items() if o != id_ and f & self.features[id_]],
+                }
+                for id_ in ids
+            ]
+        if query is tasks.REVERSE_NEIGHBOURS:
+            return [{"id": src} for src, dst in sorted(self.related) if dst in ids]
+        if query is tasks.ARTICLE_FEATURES:
+            return [{"id": id_, "features": sorted(self.features[id_])} for id_ in ids]
+        raise AssertionError(query)
+
+    # Doublure du driver et de la session
+    def session(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute_write(self, func):
+        fake = self
+
+        class Tx:
+            def run(self, query, rows):
+                fake.rows.extend(rows)
+                return self
+
+            def consume(self):
+                pass
+
+        func(Tx())
+
+
+def test_related_articles_rescores_reverse_neighbours(monkeypatch):
+    # b a perdu le topic partagé avec a : le score stocké a→b est périmé
+    graph = FakeArticles(
+        features={"a": {"Topic:x"}, "b": {"Topic:y"}, "c": {"Topic:y"}},
+        related={("a", "b")},
+    )
+    monkeypatch.setattr(tasks, "read", graph.read)
+    monkeypatch.setattr(tasks, "get_driver", lambda: graph)
+
+    processed = tasks.related_articles({"Article": ["b"]})
+
+    rows = {row["id"]: row["related"] for row in graph.rows}
+    assert processed == 3
+    assert rows["a"] == []
+    assert rows["b"] == [{"id": "c", "score": 1.0}]
+    assert rows["c"] == [{"id": "b", "score": 1.0}]
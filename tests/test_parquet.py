@@ -0,0 +1,73 @@
+# tests/test_parquet.py
+
+import os
+import sys
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+from export_parquet import node_query, node_schema, rel_query, rel_schema  # noqa: E402
+from import_parquet import _node_rows, _rel_rows  # noqa: E402
+
+
+def test_node_and_rel_queries():
+    assert node_query("Tag") == "MATCH (n:Tag) RETURN n.name AS name, n.cluster_id AS cluster_id"
+    assert rel_query("HAS_TOPIC") == (
+        "MATCH (s:Article)-[r:HAS_TOPIC]->(d:Topic) RETURN s.id AS src, d.name AS dst"
+    )
+    assert rel_query("RELATED_ARTICLE") == (
+        "MATCH (s:Article)-[r:RELATED_ARTICLE]->(d:Article) "
+        "RETURN s.id AS src, d.id AS dst, r.score AS score"
+    )
+    assert rel_schema("DUPLICATE_OF").names == ["src", "dst", "similarity"]
+
+
+def test_rows_drop_nulls_and_nest_props():
+    assert _node_rows([{"id": "a1", "title": "T", "summary": None}]) == [{"id": "a1", "title": "T"}]
+
+    to_rows = _rel_rows({"score": pa.float64()})
+    assert to_rows(
+        [
+            {"src": "a1", "dst": "a2", "score": 0.5},
+            {"src": "a1", "dst": "a3", "score": None},
+        ]
+    ) == [
+        {"src": "a1", "dst": "a2", "props": {"score": 0.5}},
+        {"src": "a1", "dst": "a3", "props": {}},
+    ]
+
+
+def test_article_parquet_round_trip(tmp_path):
+    schema = node_schema("Article")
+    path = tmp_path / "nodes_Article.parquet"
+    articles = [
+        {
+            "id": f"article-{i}",
+            "title": f"Title {i}",
+            "summary": None if i % 2 else f"Summary {i}",
+            "url": None,
+            "source": "wiki",
+            "language": "fr",
+            "cluster_id": i % 3,
+            "minhash": [i, i + 1, 2 ** 40] if i % 3 else None,
+        }
+        for i in range(7)
+    ]
+
+    # Écriture par record batches, comme export_query
+    with pq.ParquetWriter(path, schema, compression="zstd") as writer:
+        for start in range(0, len(articles), 3):
+            chunk = articles[start:start + 3]
+            columns = {name: [row[name] for row in chunk] for name in schema.names}
+            writer.write_batch(pa.RecordBatch.from_pydict(columns, schema=schema))
+
+    # Lecture par batches, comme import_file
+    rows = []
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=2):
+        rows.extend(_node_rows(batch.to_pylist()))
+
+    assert rows == [{k: v for k, v in a.items() if v is not None} for a in articles]
+    assert rows[1]["minhash"] == [1, 2, 2 ** 40]
+    assert "minhash" not in rows[0]
@@ -0,0 +1,103 @@
+# tests/test_profiling.py
+
+import asyncio
+import json
+import time
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from app import profiling
+
+TOKEN = "s3cret"
+
+
+@pytest.fixture
+def profiled_client(monkeypatch, tmp_path):
+    """
+    App minimale avec PROFILING_ENABLED : la configuration est lue à la
+    création des routes et à install_profiling, d'où une app dédiée.
+    """
+    monkeypatch.setattr(profiling, "PROFILING_ENABLED", True)
+    monkeypatch.setattr(profiling, "PROFILING_TOKEN", TOKEN)
+    monkeypatch.setattr(profiling, "PROFILING_SAMPLE_RATE", 0.0)
+    monkeypatch.setattr(profiling, "PROFILING_INTERVAL_MS", 1.0)
+    monkeypatch.setattr(profiling, "PROFILING_OUTPUT_DIR", str(tmp_path))
+
+    router = APIRouter(route_class=profiling.ProfiledRoute)
+
+    @router.get("/slow")
+    def slow():
+        with profiling.phase("db"):
+            time.sleep(0.03)
+        with profiling.phase("decode"):
+            rows = list(range(10))
+        with profiling.phase("model"):
+            return {"rows": rows}
+
+    @router.get("/async-slow")
+    async def async_slow():
+        with profiling.phase("db"):
+            await asyncio.sleep(0.03)
+        return {}
+
+    application = FastAPI()
+    profiling.install_profiling(application)
+    application.include_router(router)
+    return TestClient(application), tmp_path
+
+
+def test_profiled_request_reports_server_timing_and_writes_files(profiled_client):
+    client, output_dir = profiled_client
+    response = client.get("/slow", headers={"X-Profile": TOKEN})
+    assert response.status_code == 200
+
+    timings = {}
+    for entry in response.headers["server-timing"].split(", "):
+        name, dur = entry.split(";dur=")
+        timings[name] = float(dur)
+    assert set(timings) == {"db", "decode", "model", "serialize", "total"}
+    assert timings["db"] >= 25
+    assert timings["total"] >= timings["db"]
+
+    profile_id = response.headers["x-profile-id"]
+    folded = list(output_dir.glob(f"*{profile_id}.folded"))
+    speedscope = list(output_dir.glob(f"*{profile_id}.speedscope.json"))
+    assert len(folded) == 1 and len(speedscope) == 1
+
+    lines = folded[0].read_text(encoding="utf-8").splitlines()
+    assert lines and any("slow" in line for line in lines)
+    # Endpoint synchrone : seul son thread du threadpool est échantillonné
+    assert all(line.startswith("thread-") for line in lines)
+    data = json.loads(speedscope[0].read_text(encoding="utf-8"))
+    assert data["profiles"][0]["type"] == "sampled"
+    assert data["profiles"][0]["samples"]
+
+
+def test_async_endpoint_samples_are_labelled_event_loop(profiled_client):
+    client, output_dir = profiled_client
+    response = client.get("/async-slow", headers={"X-Profile": TOKEN})
+    assert response.status_code == 200
+
+    profile_id = response.headers["x-profile-id"]
+    lines = next(output_dir.glob(f"*{profile_id}.folded")).read_text(encoding="utf-8").splitlines()
+    assert lines
+    assert all(line.startswith("event-loop (shared);") for line in lines)
+
+
+def test_wrong_token_is_not_profiled(profiled_client):
+    client, output_dir = profiled_client
+    response = client.get("/slow", headers={"X-Profile": "1"})
+    assert response.status_code == 200
+    assert "server-timing" not in response.headers
+    assert not list(output_dir.iterdir())
+
+
+def test_header_ignored_without_token(profiled_client, monkeypatch):
+    client, output_dir = profiled_client
+    monkeypatch.setattr(profiling, "PROFILING_TOKEN", None)
+    response = client.get("/slow", headers={"X-Profile": "1"})
+    assert response.status_code == 200
+    assert "server-timing" not in response.headers
+    assert not list(output_dir.iterdir())
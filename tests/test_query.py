@@ -0,0 +1,99 @@
+# tests/test_query.py
+
+from fastapi.testclient import TestClient
+from app.database.loaders import ARTICLE_RELATED, DataLoader
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_composite_query_article_1():
+    # Avec le seed, article-1 est écrit par author-1 et a des topics / tags
+    response = client.post(
+        "/api/query",
+        json={
+            "article_ids": ["article-1", "unknown-article"],
+            "select": {
+                "authors": {"articles": True, "topics": True},
+                "topics": {"related_topics": True},
+                "tags": True,
+            },
+        },
+    )
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["missing"] == ["unknown-article"]
+    assert len(data["articles"]) == 1
+
+    article = data["articles"][0]
+    assert article["id"] == "article-1"
+    assert len(article["authors"]) >= 1
+    assert len(article["topics"]) >= 1
+    assert isinstance(article["tags"], list)
+
+    # Sous-sélections imbriquées
+    author = article["authors"][0]
+    assert isinstance(author["articles"], list)
+    assert isinstance(author["topics"], list)
+    assert "related_topics" in article["topics"][0]
+
+    # Les champs non sélectionnés ne sont pas renvoyés
+    assert "related" not in article
+    assert "articles" not in article["topics"][0]
+
+
+def test_composite_query_requires_ids():
+    response = client.post("/api/query", json={"article_ids": []})
+    assert response.status_code == 400
+
+
+class FakeResult(list):
+    def consume(self):
+        pass
+
+
+class CountingSession:
+    """
+    Session factice : execute_read compte les requêtes et renvoie une ligne
+    (id, value) par id connu de `values`.
+    """
+
+    def __init__(self, values):
+        self.values = values
+        self.queries = []
+
+    def execute_read(self, func, query, params):
+        self.queries.append(params)
+        values = self.values
+
+        class Tx:
+            def run(self, query, params):
+                return FakeResult([{"id": i, "value": values[i]} for i in params["ids"] if i in values])
+
+        return func(Tx(), query, params)
+
+
+def test_data_loader_batches_and_memoizes():
+    session = CountingSession({"a1": "A1", "a2": "A2", "a3": "A3"})
+    loader = DataLoader(session, ARTICLE_RELATED, default=list, limit=5)
+
+    # Clés répétées, None ignoré, id inconnu : une seule requête
+    assert loader.load_many(["a1", "a2", "a1", None, "missing"]) == {
+        "a1": "A1",
+        "a2": "A2",
+        "missing": [],
+    }
+    assert session.queries == [{"ids": ["a1", "a2", "missing"], "limit": 5}]
+
+    # Clés en cache : aucune requête
+    assert loader.load_many(["a2", "missing", "a1"]) == {"a2": "A2", "missing": [], "a1": "A1"}
+    assert len(session.queries) == 1
+
+    # Chevauchement : seules les nouvelles clés sont demandées
+    assert loader.load_many(["a1", "a3"]) == {"a1": "A1", "a3": "A3"}
+    assert session.queries[1] == {"ids": ["a3"], "limit": 5}
+
+    # default() appelé par id manquant : pas de liste partagée
+    loader.load_many(["x", "y"])["x"].append(1)
+    assert loader.load_many(["y"]) == {"y": []}
@@ -0,0 +1,53 @@
+# tests/test_resilience.py
+
+from fastapi.testclient import TestClient
+from neo4j.exceptions import ServiceUnavailable, TransientError
+
+from app.database.neo4j import get_db
+from app.main import app
+
+client = TestClient(app)
+
+
+class FlakySession:
+    """
+    Session factice : execute_read lève `error` (comme le driver une fois
+    ses nouvelles tentatives épuisées) `failures` fois, puis ne renvoie rien.
+    """
+
+    def __init__(self, failures, error):
+        self.failures = failures
+        self.error = error
+
+    def execute_read(self, func, *args):
+        if self.failures:
+            self.failures -= 1
+            raise self.error
+        return []
+
+
+def _override(session):
+    def get_fake_db():
+        yield session
+    return get_fake_db
+
+
+def test_unavailable_database_returns_503():
+    app.dependency_overrides[get_db] = _override(FlakySession(1, ServiceUnavailable("down")))
+    try:
+        response = client.get("/api/topics/any/graph")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+
+
+def test_transient_error_returns_503():
+    app.dependency_overrides[get_db] = _override(FlakySession(1, TransientError("deadlock")))
+    try:
+        response = client.get("/api/search", params={"q": "graph"})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 503